@@ -195,6 +195,7 @@ class ArcaneScribeStack(Stack):
                     BEDROCK_EMBEDDING_MODEL_ID
                 ),  # For query embedding
                 "QUERY_CACHE_TABLE_NAME": self.query_cache_table.table_name,
+                "PREFETCH_SRD_ID": "dnd5e_srd",  # Warm at cold start
             },
             memory_size=1024,  # More memory for processing queries
             timeout=Duration.seconds(60),
@@ -35,6 +35,12 @@ def test_and_lint(session):
         "run",
         "pytest",
         "-s",
+        # Keep each test file on one worker so its session fixtures are
+        # shared by all of its tests
+        "-n",
+        "auto",
+        "--dist",
+        "loadfile",
         "--cov-report",
         "term-missing",
         "--cov=.",
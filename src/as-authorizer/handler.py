@@ -1,5 +1,6 @@
 # Standard Library
 import os
+from typing import Optional
 
 # Third Party
 from aws_lambda_powertools import Logger
@@ -24,33 +25,33 @@ if not EXPECTED_HEADER_NAME_CONFIG or not EXPECTED_HEADER_VALUE:
     # but for an authorizer, simply denying access might be the desired behavior.
 
 
-@logger.inject_lambda_context(log_event=False)
-def lambda_handler(event: dict, context: LambdaContext) -> dict:
-    """
-    Basic Lambda authorizer for API Gateway HTTP API.
-    Checks for a custom header and validates its value.
+def _authorize(
+    event: dict,
+    expected_header_name: str,
+    expected_header_value: Optional[str],
+) -> dict:
+    """Check the request's auth header against the expected name and value.
 
     Parameters
     ----------
     event : dict
-        The event payload from API Gateway. For HTTP API Lambda authorizers of type 'REQUEST',
-        this contains headers, route information, etc.
-    context : LambdaContext
-        The Lambda runtime context.
+        The event payload from API Gateway.
+    expected_header_name : str
+        The lowercase name of the required header. Empty if not configured.
+    expected_header_value : Optional[str]
+        The required header value, or None if not configured.
 
     Returns
     -------
     dict
-        An authorization response object.
-        {"isAuthorized": True} if authorized,
-        {"isAuthorized": False} if not.
-        Optionally can include a 'context' dictionary.
+        ``{"isAuthorized": True}`` if authorized, otherwise
+        ``{"isAuthorized": False}``.
     """
     logger.info(
         "Authorizer invoked.", extra={"route_arn": event.get("routeArn")}
     )
 
-    if not EXPECTED_HEADER_NAME_CONFIG or not EXPECTED_HEADER_VALUE:
+    if not expected_header_name or not expected_header_value:
         logger.error(
             "Authorizer is misconfigured (missing env vars). Denying request."
         )
@@ -59,20 +60,47 @@ def lambda_handler(event: dict, context: LambdaContext) -> dict:
     # HTTP headers are case-insensitive. Normalize incoming header names to lowercase for comparison.
     headers = {k.lower(): v for k, v in event.get("headers", {}).items()}
 
-    auth_header_value = headers.get(EXPECTED_HEADER_NAME_CONFIG)
+    auth_header_value = headers.get(expected_header_name)
 
-    if auth_header_value and auth_header_value == EXPECTED_HEADER_VALUE:
+    if auth_header_value and auth_header_value == expected_header_value:
         logger.info(
-            f"Authorization successful for header: {EXPECTED_HEADER_NAME_CONFIG}"
+            f"Authorization successful for header: {expected_header_name}"
         )
         return {"isAuthorized": True}
     else:
         if not auth_header_value:
             logger.warning(
-                f"Authorization denied. Missing required header: {EXPECTED_HEADER_NAME_CONFIG}"
+                f"Authorization denied. Missing required header: {expected_header_name}"
             )
         else:
             logger.warning(
-                f"Authorization denied. Invalid value for header: {EXPECTED_HEADER_NAME_CONFIG}"
+                f"Authorization denied. Invalid value for header: {expected_header_name}"
             )
         return {"isAuthorized": False}
+
+
+@logger.inject_lambda_context(log_event=False)
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    """
+    Basic Lambda authorizer for API Gateway HTTP API.
+    Checks for a custom header and validates its value.
+
+    Parameters
+    ----------
+    event : dict
+        The event payload from API Gateway. For HTTP API Lambda authorizers of type 'REQUEST',
+        this contains headers, route information, etc.
+    context : LambdaContext
+        The Lambda runtime context.
+
+    Returns
+    -------
+    dict
+        An authorization response object.
+        {"isAuthorized": True} if authorized,
+        {"isAuthorized": False} if not.
+        Optionally can include a 'context' dictionary.
+    """
+    return _authorize(
+        event, EXPECTED_HEADER_NAME_CONFIG, EXPECTED_HEADER_VALUE
+    )
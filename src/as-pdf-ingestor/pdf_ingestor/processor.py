@@ -1,11 +1,13 @@
 # Standard Library
 import os
-import shutil
+import re
+import tempfile
 from pathlib import Path
 from typing import Tuple
 
 # Third Party
 import boto3
+import faiss
 from botocore.exceptions import ClientError
 from aws_lambda_powertools import Logger
 from langchain_community.document_loaders import PyPDFLoader
@@ -16,10 +18,16 @@ from langchain_community.vectorstores import FAISS
 # Initialize logger
 logger = Logger(service="pdf_ingestor_processor_bedrock")
 
+# One session for both clients, so credentials and endpoint data are
+# resolved once per container
+_boto_session = boto3.session.Session()
+
 # Initialize Bedrock runtime client
 try:
-    s3_client = boto3.client("s3")
-    bedrock_runtime_client = boto3.client(service_name="bedrock-runtime")
+    s3_client = _boto_session.client("s3")
+    bedrock_runtime_client = _boto_session.client(
+        service_name="bedrock-runtime"
+    )
 except Exception as e:
     logger.exception(
         f"Failed to initialize Boto3 clients in processor module: {e}"
@@ -48,6 +56,16 @@ except Exception as e:
 # Get the S3 bucket name for storing the FAISS index
 VECTOR_STORE_BUCKET_NAME = os.environ.get("VECTOR_STORE_BUCKET_NAME")
 
+# FAISS index_factory description used for the stored index. "SQ8" keeps one
+# byte per vector component; product quantized IVF layouts such as
+# "OPQ32,IVF256,PQ32" shrink large SRDs much further.
+FAISS_INDEX_FACTORY = os.environ.get("FAISS_INDEX_FACTORY", "SQ8")
+FALLBACK_INDEX_FACTORY = "SQ8"  # Needs no minimum number of vectors
+
+# Characters replaced when sanitizing file names. \w is Unicode-aware and
+# matches what str.isalnum() accepts, plus the underscore.
+_UNSAFE_FILE_NAME_CHARS = re.compile(r"[^\w.-]")
+
 
 def extract_srd_info(object_key: str) -> Tuple[str, str]:
     """Extract the SRD ID and filename from the S3 object key.
@@ -78,6 +96,49 @@ def extract_srd_info(object_key: str) -> Tuple[str, str]:
     return parts[0], parts[1]
 
 
+def quantize_index(
+    index: faiss.Index, factory_string: str = FAISS_INDEX_FACTORY
+) -> faiss.Index:
+    """Re-encode a flat FP32 FAISS index with a compressed index type.
+
+    By default each vector component is stored as one byte instead of four,
+    shrinking the serialized index (and the memory it takes once loaded) by
+    about 4x at a typically negligible recall cost for Titan embeddings.
+    Clustered or product quantized layouts need enough vectors to train
+    on, so SRDs too small for them fall back to ``FALLBACK_INDEX_FACTORY``.
+
+    Parameters
+    ----------
+    index : faiss.Index
+        The flat index built by ``FAISS.from_documents``.
+    factory_string : str, optional
+        The ``faiss.index_factory`` description of the new index, by default
+        ``FAISS_INDEX_FACTORY``.
+
+    Returns
+    -------
+    faiss.Index
+        The new index holding the same vectors, in the same order, with the
+        same metric.
+    """
+    vectors = index.reconstruct_n(0, index.ntotal)
+    quantized_index = faiss.index_factory(
+        index.d, factory_string, index.metric_type
+    )
+    try:
+        quantized_index.train(vectors)
+    except RuntimeError as e:
+        if factory_string == FALLBACK_INDEX_FACTORY:
+            raise
+        logger.warning(
+            f"Could not train '{factory_string}' FAISS index: {e}. "
+            f"Using '{FALLBACK_INDEX_FACTORY}'."
+        )
+        return quantize_index(index, FALLBACK_INDEX_FACTORY)
+    quantized_index.add(vectors)
+    return quantized_index
+
+
 def process_s3_object(
     bucket_name: str, object_key: str, lambda_logger: Logger
 ) -> None:
@@ -109,107 +170,104 @@ def process_s3_object(
 
     # Validate the bucket name and object key
     base_file_name = os.path.basename(filename)
-    safe_base_file_name = "".join(
-        c if c.isalnum() or c in [".", "-"] else "_" for c in base_file_name
-    )
-    temp_pdf_path = f"/tmp/{safe_base_file_name}"
-    temp_faiss_index_name = f"{srd_id}_faiss_index"
-    temp_faiss_index_path = f"/tmp/{temp_faiss_index_name}"
+    safe_base_file_name = _UNSAFE_FILE_NAME_CHARS.sub("_", base_file_name)
 
-    try:
-        # Download the PDF file from S3
-        lambda_logger.info(
-            f"Downloading s3://{bucket_name}/{object_key} to {temp_pdf_path}"
-        )
-        s3_client.download_file(bucket_name, object_key, temp_pdf_path)
-        lambda_logger.info(f"Successfully downloaded PDF to {temp_pdf_path}")
+    # Work in a fresh temporary directory, removed on exit even on failure
+    with tempfile.TemporaryDirectory(
+        prefix=f"{_UNSAFE_FILE_NAME_CHARS.sub('_', srd_id)}_",
+        ignore_cleanup_errors=True,
+    ) as temp_dir:
+        temp_pdf_path = os.path.join(temp_dir, safe_base_file_name)
+        temp_faiss_index_path = os.path.join(temp_dir, "faiss_index")
 
-        # Load the PDF document using PyPDFLoader
-        lambda_logger.info(
-            f"Loading PDF document from {temp_pdf_path} using PyPDFLoader."
-        )
-        loader = PyPDFLoader(temp_pdf_path)
-        documents = loader.load()
-        lambda_logger.info(
-            f"Loaded {len(documents)} document pages/sections from PDF."
-        )
-        if not documents:
-            lambda_logger.warning(
-                f"No documents loaded from PDF: {object_key}."
+        try:
+            # Download the PDF file from S3
+            lambda_logger.info(
+                f"Downloading s3://{bucket_name}/{object_key} to {temp_pdf_path}"
+            )
+            s3_client.download_file(bucket_name, object_key, temp_pdf_path)
+            lambda_logger.info(
+                f"Successfully downloaded PDF to {temp_pdf_path}"
             )
-            return
 
-        # Split the document into manageable text chunks
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000, chunk_overlap=200
-        )
-        texts = text_splitter.split_documents(documents)
-        lambda_logger.info(f"Split into {len(texts)} text chunks.")
-        if not texts:
-            lambda_logger.warning(f"No text chunks generated: {object_key}.")
-            return
-
-        # Generate embeddings for the text chunks using Bedrock
-        lambda_logger.info(
-            "Generating embeddings with Bedrock and creating FAISS index..."
-        )
-        vector_store = FAISS.from_documents(texts, embedding_model)
-        lambda_logger.info("FAISS index created successfully in memory.")
-
-        # Save the FAISS index to a temporary directory
-        if os.path.exists(temp_faiss_index_path):
-            shutil.rmtree(temp_faiss_index_path)
-        os.makedirs(temp_faiss_index_path, exist_ok=True)
-        vector_store.save_local(folder_path=temp_faiss_index_path)
-        lambda_logger.info(
-            f"FAISS index saved locally to directory: {temp_faiss_index_path}"
-        )
+            # Load the PDF document using PyPDFLoader
+            lambda_logger.info(
+                f"Loading PDF document from {temp_pdf_path} using PyPDFLoader."
+            )
+            loader = PyPDFLoader(temp_pdf_path)
+            documents = loader.load()
+            lambda_logger.info(
+                f"Loaded {len(documents)} document pages/sections from PDF."
+            )
+            if not documents:
+                lambda_logger.warning(
+                    f"No documents loaded from PDF: {object_key}."
+                )
+                return
+
+            # Split the document into manageable text chunks
+            text_splitter = RecursiveCharacterTextSplitter(
+                chunk_size=1000, chunk_overlap=200
+            )
+            texts = text_splitter.split_documents(documents)
+            lambda_logger.info(f"Split into {len(texts)} text chunks.")
+            if not texts:
+                lambda_logger.warning(
+                    f"No text chunks generated: {object_key}."
+                )
+                return
 
-        # Upload the FAISS index files to S3
-        s3_index_prefix = f"{srd_id}/faiss_index"
-        for file_name_in_index_dir in os.listdir(temp_faiss_index_path):
-            local_file_to_upload = os.path.join(
-                temp_faiss_index_path, file_name_in_index_dir
+            # Generate embeddings for the text chunks using Bedrock
+            lambda_logger.info(
+                "Generating embeddings with Bedrock and creating FAISS index..."
             )
-            s3_target_key = f"{s3_index_prefix}/{file_name_in_index_dir}"
+            vector_store = FAISS.from_documents(texts, embedding_model)
+            lambda_logger.info("FAISS index created successfully in memory.")
+
+            # Store vectors as int8 to shrink the index shipped to the RAG
+            # Lambda
+            vector_store.index = quantize_index(vector_store.index)
             lambda_logger.info(
-                f"Uploading {local_file_to_upload} to s3://{VECTOR_STORE_BUCKET_NAME}/{s3_target_key}"
+                "FAISS index re-encoded as "
+                f"{type(vector_store.index).__name__}."
             )
-            s3_client.upload_file(
-                local_file_to_upload, VECTOR_STORE_BUCKET_NAME, s3_target_key
+
+            # Save the FAISS index to the temporary directory
+            vector_store.save_local(folder_path=temp_faiss_index_path)
+            lambda_logger.info(
+                f"FAISS index saved locally to directory: {temp_faiss_index_path}"
             )
-        lambda_logger.info(
-            f"FAISS index for {object_key} uploaded to S3: {VECTOR_STORE_BUCKET_NAME}/{s3_index_prefix}"
-        )
 
-    # Handle specific AWS errors and log them
-    except ClientError as e:
-        lambda_logger.exception(
-            f"AWS ClientError during processing of {object_key}: {e}"
-        )
-        raise
-    except Exception as e:
-        lambda_logger.exception(
-            f"Unexpected error during processing of {object_key}: {e}"
-        )
-        raise
-    finally:
-        # Clean up temporary files and directories
-        if os.path.exists(temp_pdf_path):
-            try:
-                os.remove(temp_pdf_path)
-            except Exception as e_clean:
-                lambda_logger.error(
-                    f"Error cleaning temp PDF {temp_pdf_path}: {e_clean}"
+            # Upload the FAISS index files to S3
+            s3_index_prefix = f"{srd_id}/faiss_index"
+            for file_name_in_index_dir in os.listdir(temp_faiss_index_path):
+                local_file_to_upload = os.path.join(
+                    temp_faiss_index_path, file_name_in_index_dir
                 )
-        # Clean up the FAISS index directory
-        if os.path.exists(temp_faiss_index_path):
-            try:
-                shutil.rmtree(temp_faiss_index_path)
-            except Exception as e_clean:
-                lambda_logger.error(
-                    f"Error cleaning temp FAISS dir {temp_faiss_index_path}: {e_clean}"
+                s3_target_key = f"{s3_index_prefix}/{file_name_in_index_dir}"
+                lambda_logger.info(
+                    f"Uploading {local_file_to_upload} to s3://{VECTOR_STORE_BUCKET_NAME}/{s3_target_key}"
                 )
+                s3_client.upload_file(
+                    local_file_to_upload,
+                    VECTOR_STORE_BUCKET_NAME,
+                    s3_target_key,
+                )
+            lambda_logger.info(
+                f"FAISS index for {object_key} uploaded to S3: {VECTOR_STORE_BUCKET_NAME}/{s3_index_prefix}"
+            )
+
+        # Handle specific AWS errors and log them
+        except ClientError as e:
+            lambda_logger.exception(
+                f"AWS ClientError during processing of {object_key}: {e}"
+            )
+            raise
+        except Exception as e:
+            lambda_logger.exception(
+                f"Unexpected error during processing of {object_key}: {e}"
+            )
+            raise
 
     # Save metadata about the processed document
     metadata = {
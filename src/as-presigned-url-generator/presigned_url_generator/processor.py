@@ -16,13 +16,31 @@ except Exception as e:
     logger.exception(f"Failed to initialize Boto3 S3 client globally: {e}")
     raise e
 
+
+def _require_bucket_name() -> str:
+    """Get the documents bucket name from the environment.
+
+    Returns
+    -------
+    str
+        The value of the DOCUMENTS_BUCKET_NAME environment variable.
+
+    Raises
+    ------
+    Exception
+        If DOCUMENTS_BUCKET_NAME is not set.
+    """
+    bucket_name = os.environ.get("DOCUMENTS_BUCKET_NAME")
+    if not bucket_name:
+        logger.error("DOCUMENTS_BUCKET_NAME environment variable is not set.")
+        raise Exception(
+            "Environment variable DOCUMENTS_BUCKET_NAME must be set for S3 operations."
+        )
+    return bucket_name
+
+
 # Retrieve environment variables
-DOCUMENTS_BUCKET_NAME = os.environ.get("DOCUMENTS_BUCKET_NAME")
-if not DOCUMENTS_BUCKET_NAME:
-    logger.error("DOCUMENTS_BUCKET_NAME environment variable is not set.")
-    raise Exception(
-        "Environment variable DOCUMENTS_BUCKET_NAME must be set for S3 operations."
-    )
+DOCUMENTS_BUCKET_NAME = _require_bucket_name()
 
 
 def generate_presigned_url(
@@ -1,13 +1,27 @@
 # Standard Library
+import io
 import os
+import re
+import fcntl
 import time
 import json
+import math
+import array
+import pickle
 import shutil
 import hashlib
-from typing import Optional, Dict, Any
+import threading
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Annotated
 
 # Third Party
 import boto3
+import faiss
+import zstandard as zstd
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from aws_lambda_powertools import Logger
 from langchain_aws import (
@@ -15,18 +29,63 @@ from langchain_aws import (
     ChatBedrock,
 )
 from langchain_community.vectorstores import FAISS
-from langchain.chains.retrieval_qa.base import RetrievalQA
 from langchain.prompts import PromptTemplate
+from pydantic import BaseModel, Field, StrictStr, ValidationError
 
 # Initialize logger
 logger = Logger(service="rag_query_processor_bedrock")
 
+# Optional DAX cluster endpoint fronting the query cache table
+DAX_ENDPOINT = os.environ.get("DAX_ENDPOINT")
+
+# Shared botocore config: a larger keep-alive connection pool and adaptive
+# retries so throttled calls back off instead of failing straight away
+BOTO_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    connect_timeout=2,
+    read_timeout=60,  # Leaves room for long Bedrock generations
+)
+
+# One session for all clients, so credentials and endpoint data are
+# resolved once per container
+_boto_session = boto3.session.Session()
+
+
+def _create_cache_client() -> Any:
+    """Create the client used for the query cache.
+
+    Uses a DAX client when ``DAX_ENDPOINT`` is set, falling back to a plain
+    DynamoDB client if DAX is not configured or cannot be initialized. Both
+    expose the same ``get_item``/``put_item`` API.
+
+    Returns
+    -------
+    Any
+        The DAX or DynamoDB client.
+    """
+    if DAX_ENDPOINT:
+        try:
+            # Third Party
+            from amazondax import AmazonDaxClient
+
+            return AmazonDaxClient(endpoint_url=DAX_ENDPOINT)
+        except Exception as e:
+            logger.warning(
+                f"Failed to initialize DAX client: {e}. Using DynamoDB."
+            )
+    return _boto_session.client("dynamodb", config=BOTO_CLIENT_CONFIG)
+
+
 # Initialize Boto3 clients for S3, DynamoDB (for caching), and Bedrock runtime
 try:
-    s3_client = boto3.client("s3")
-    dynamodb_client = boto3.client("dynamodb")  # For caching
+    s3_client = _boto_session.client("s3", config=BOTO_CLIENT_CONFIG)
+    dynamodb_client = _create_cache_client()  # For caching
     # Initialize Bedrock runtime client. Region should be picked up from AWS_DEFAULT_REGION env var.
-    bedrock_runtime_client = boto3.client(service_name="bedrock-runtime")
+    bedrock_runtime_client = _boto_session.client(
+        service_name="bedrock-runtime", config=BOTO_CLIENT_CONFIG
+    )
 except Exception as e:
     logger.exception(
         f"Failed to initialize Boto3 clients in RAG processor: {e}"
@@ -47,13 +106,46 @@ BEDROCK_TEXT_GENERATION_MODEL_ID = os.environ.get(
 VECTOR_STORE_BUCKET_NAME = os.environ.get("VECTOR_STORE_BUCKET_NAME")
 QUERY_CACHE_TABLE_NAME = os.environ.get("QUERY_CACHE_TABLE_NAME")
 
+# Optional SRD whose FAISS index is fetched in the background at cold start
+PREFETCH_SRD_ID = os.environ.get("PREFETCH_SRD_ID")
+
 # Default SRD ID for the System Reference Document (SRD) and cache settings
 DEFAULT_SRD_ID = "dnd5e_srd"
 CACHE_TTL_SECONDS = 3600  # Cache responses for 1 hour, adjust as needed
+NEGATIVE_CACHE_TTL_SECONDS = 120  # Cache "no answer" responses briefly
+NO_ANSWER = "No answer generated."
+EMBEDDING_CACHE_TTL_SECONDS = 7 * 24 * 3600  # Query embeddings for 1 week
+
+# Settings for the FAISS index cache, mapping SRD IDs to the vector store
+# and its index file size (least recently used first)
+faiss_index_cache: OrderedDict[str, tuple[FAISS, int]] = OrderedDict()
+FAISS_CACHE_BYTES = int(os.environ.get("FAISS_CACHE_BYTES", 512 * 1024 * 1024))
+RETRIEVAL_K = 4  # Number of chunks retrieved per query
+# Guards faiss_index_cache and _faiss_srd_locks; only held briefly
+_faiss_index_lock = threading.Lock()
+# One lock per SRD ID, held while that SRD's index is loaded
+_faiss_srd_locks: Dict[str, threading.Lock] = {}
+
+# FAISS index files are kept on local disk across warm invocations and
+# memory-mapped from there. FAISS_LOCAL_ROOT may point at a file system
+# shared between containers, such as an EFS mount.
+FAISS_LOCAL_ROOT = os.environ.get("FAISS_LOCAL_ROOT", "/tmp")
+FAISS_INDEX_FILES = ("index.faiss", "index.pkl")
+_UNSAFE_SRD_ID_CHARS = re.compile(r"[^\w-]")
 
-# Settings for the FAISS index cache
-faiss_index_cache: dict[str, FAISS] = {}
-MAX_CACHE_SIZE = 3
+# Let FAISS searches use every vCPU available to the function
+faiss.omp_set_num_threads(os.cpu_count() or 1)
+MIN_IVF_NPROBE = 8  # Fewest inverted lists probed per IVF search
+
+# Block size used when streaming an index from S3 without a local copy
+FAISS_STREAM_BLOCK_SIZE = 1024 * 1024
+
+# Ranged, concurrent GETs for the FAISS index files
+FAISS_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+)
 
 # Initialize the embedding model
 try:
@@ -72,6 +164,126 @@ except Exception as e:
 # Initialize default LLM instance
 _default_llm_instance = None
 
+# Worker pool used to overlap blocking I/O (cache lookup, index load)
+_io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rag-io")
+
+# Zstandard codec for cached answer bodies. Both are only used from the
+# request thread, as zstandard compressors are not thread safe.
+_answer_compressor = zstd.ZstdCompressor(level=3)
+_answer_decompressor = zstd.ZstdDecompressor()
+
+# Worker pool for cache writes, which are kept off the response path
+_cache_write_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="rag-cache-write"
+)
+
+# Prompt template for the generative LLM, built once per container.
+# This prompt template is crucial for guiding the LLM's response.
+PROMPT_TEMPLATE_STR = """You are 'Arcane Scribe', a helpful TTRPG assistant.
+Based *only* on the following context from the System Reference Document (SRD), provide a concise and direct answer to the question.
+If the question (which might be formatted as 'User: ... Bot:') asks for advice, optimization (e.g., "min-max"), or creative ideas, you may synthesize or infer suggestions *grounded in the provided SRD context*.
+Do not introduce rules, abilities, or concepts not present in or directly supported by the context.
+If the context does not provide enough information for a comprehensive answer or suggestion, state that clearly.
+Always be helpful and aim to directly address the user's intent.
+If the question is not formatted as 'User: ... Bot:', you may assume it is a direct question and respond accordingly.
+
+Context:
+{context}
+
+Question: {question}
+
+Helpful Answer:"""
+PROMPT = PromptTemplate(
+    template=PROMPT_TEMPLATE_STR, input_variables=["context", "question"]
+)
+
+
+class GenerationConfig(BaseModel):
+    """Client-provided generation parameters, using Bedrock's Titan names.
+
+    Fields left unset are omitted so Bedrock applies its own defaults.
+    """
+
+    temperature: Optional[
+        Annotated[float, Field(strict=True, ge=0.0, le=1.0)]
+    ] = None
+    topP: Optional[Annotated[float, Field(strict=True, ge=0.0, le=1.0)]] = None
+    # Titan Text Express max is 8192, Lite is 4096
+    maxTokenCount: Optional[
+        Annotated[int, Field(strict=True, ge=0, le=8192)]
+    ] = None
+    stopSequences: Optional[list[StrictStr]] = None
+
+
+# Maps GenerationConfig fields to Converse API inference parameter names
+CONVERSE_PARAM_NAMES = {
+    "temperature": "temperature",
+    "topP": "top_p",
+    "maxTokenCount": "max_tokens",
+    "stopSequences": "stop_sequences",
+}
+
+
+def _validate_generation_config(
+    generation_config: Dict[str, Any],
+) -> GenerationConfig:
+    """Validate the client generation config, dropping invalid fields.
+
+    Parameters
+    ----------
+    generation_config : Dict[str, Any]
+        The raw generation config from the request.
+
+    Returns
+    -------
+    GenerationConfig
+        The validated config. Each invalid field is logged and left unset.
+    """
+    try:
+        return GenerationConfig.model_validate(generation_config)
+    except ValidationError as e:
+        invalid_fields = {error["loc"][0] for error in e.errors()}
+
+    for field in invalid_fields:
+        logger.warning(
+            f"Invalid {field} value: {generation_config[field]}. "
+            "Using default."
+        )
+    return GenerationConfig.model_validate(
+        {
+            key: value
+            for key, value in generation_config.items()
+            if key not in invalid_fields
+        }
+    )
+
+
+@lru_cache(maxsize=64)
+def _chat_bedrock_for(model_kwargs_key: tuple) -> ChatBedrock:
+    """Build a ChatBedrock instance, reused per distinct set of model kwargs.
+
+    Parameters
+    ----------
+    model_kwargs_key : tuple
+        Sorted ``(name, value)`` pairs of the Converse inference parameters,
+        with list values converted to tuples so the key is hashable.
+
+    Returns
+    -------
+    ChatBedrock
+        The ChatBedrock instance for these model kwargs.
+    """
+    model_kwargs = {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in model_kwargs_key
+    }
+    return ChatBedrock(
+        client=bedrock_runtime_client,
+        model=BEDROCK_TEXT_GENERATION_MODEL_ID,
+        model_kwargs=model_kwargs,
+        beta_use_converse_api=True,
+    )
+
 
 def get_llm_instance(
     generation_config: Dict[str, Any],
@@ -94,65 +306,24 @@ def get_llm_instance(
     """
     global _default_llm_instance  # Can be used if no dynamic config provided
 
-    # Initialize the model kwargs as an empty dictionary
-    effective_model_kwargs = {}
-
-    # Validate and merge client-provided generation_config
-    if "temperature" in generation_config:
-        temp = generation_config["temperature"]
-        if isinstance(temp, (float, int)) and 0.0 <= temp <= 1.0:
-            effective_model_kwargs["temperature"] = float(temp)
-        else:
-            logger.warning(
-                f"Invalid temperature value: {temp}. Using default."
-            )
-
-    if "topP" in generation_config:
-        top_p_val = generation_config["topP"]
-        if isinstance(top_p_val, (float, int)) and 0.0 <= top_p_val <= 1.0:
-            effective_model_kwargs["topP"] = float(top_p_val)
-        else:
-            logger.warning(f"Invalid topP value: {top_p_val}. Using default.")
-
-    if (
-        "maxTokenCount" in generation_config
-    ):  # Note: Bedrock API uses "maxTokenCount"
-        max_tokens = generation_config["maxTokenCount"]
-        # Titan Text Express max is 8192, Lite is 4096
-        # Assuming BEDROCK_TEXT_GENERATION_MODEL_ID is Express or Lite
-        # Add more specific validation if needed based on the exact model.
-        if isinstance(max_tokens, int) and 0 <= max_tokens <= 8192:
-            effective_model_kwargs["maxTokenCount"] = max_tokens
-        else:
-            logger.warning(
-                f"Invalid maxTokenCount: {max_tokens}. Using default or Bedrock's max."
-            )
-            # Do not set maxTokenCount if invalid to let Bedrock use its internal default or max.
-            # Or, set to a known safe default like 1024 if you prefer explicit control.
-            if "maxTokenCount" in effective_model_kwargs and not (
-                isinstance(max_tokens, int) and 0 <= max_tokens <= 8192
-            ):
-                del effective_model_kwargs[
-                    "maxTokenCount"
-                ]  # remove if invalid, let model default
-
-    if "stopSequences" in generation_config:
-        stop_seqs = generation_config["stopSequences"]
-        if isinstance(stop_seqs, list) and all(
-            isinstance(s, str) for s in stop_seqs
-        ):
-            effective_model_kwargs["stopSequences"] = stop_seqs
-        else:
-            logger.warning(
-                f"Invalid stopSequences: {stop_seqs}. Ignoring client value."
-            )
+    # Validate the client-provided generation_config and map it to the
+    # Converse API inference parameter names
+    config = _validate_generation_config(generation_config)
+    effective_model_kwargs = {
+        CONVERSE_PARAM_NAMES[key]: value
+        for key, value in config.model_dump(exclude_none=True).items()
+    }
 
-    # Create ChatBedrock instance with effective model kwargs
+    # Get the ChatBedrock instance for the effective model kwargs, routed
+    # through the model-agnostic Converse API
     try:
-        current_llm = ChatBedrock(
-            client=bedrock_runtime_client,
-            model=BEDROCK_TEXT_GENERATION_MODEL_ID,
-            model_kwargs=effective_model_kwargs,
+        current_llm = _chat_bedrock_for(
+            tuple(
+                sorted(
+                    (key, tuple(value) if isinstance(value, list) else value)
+                    for key, value in effective_model_kwargs.items()
+                )
+            )
         )
         logger.info(
             f"ChatBedrock instance configured with: {effective_model_kwargs}"
@@ -168,8 +339,9 @@ def get_llm_instance(
             model=BEDROCK_TEXT_GENERATION_MODEL_ID,
             model_kwargs={
                 "temperature": 0.1,
-                "maxTokenCount": 1024,
+                "max_tokens": 1024,
             },
+            beta_use_converse_api=True,
         )
         return _default_llm_instance  # Return the default instance if dynamic config fails
 
@@ -203,61 +375,522 @@ def _load_faiss_index_from_s3(
         lambda_logger.error("VECTOR_STORE_BUCKET_NAME not configured.")
         return None
 
-    # Check if the FAISS index is already in cache
-    if srd_id in faiss_index_cache:
-        lambda_logger.info(f"FAISS index for '{srd_id}' found in cache.")
-        return faiss_index_cache[srd_id]
+    # Serialize loads of the same index, so a prefetch and a request never
+    # fetch it twice. Loads of other SRDs are not blocked.
+    with _faiss_srd_lock(srd_id):
+        # Check if the FAISS index is already in cache
+        with _faiss_index_lock:
+            if srd_id in faiss_index_cache:
+                lambda_logger.info(
+                    f"FAISS index for '{srd_id}' found in cache."
+                )
+                faiss_index_cache.move_to_end(srd_id)
+                return faiss_index_cache[srd_id][0]
+
+        return _download_and_load_faiss_index(srd_id, lambda_logger)
 
-    # Construct the S3 key for the FAISS index
+
+def _faiss_srd_lock(srd_id: str) -> threading.Lock:
+    """Return the lock serializing FAISS index loads for an SRD.
+
+    Parameters
+    ----------
+    srd_id : str
+        The SRD ID to get the lock for.
+
+    Returns
+    -------
+    threading.Lock
+        The lock for ``srd_id``, created on first use.
+    """
+    with _faiss_index_lock:
+        return _faiss_srd_locks.setdefault(srd_id, threading.Lock())
+
+
+def _local_faiss_dir(srd_id: str) -> str:
+    """Get the local directory holding an SRD's FAISS index files.
+
+    Parameters
+    ----------
+    srd_id : str
+        The SRD ID of the FAISS index.
+
+    Returns
+    -------
+    str
+        The local directory path.
+    """
+    safe_srd_id = _UNSAFE_SRD_ID_CHARS.sub("_", srd_id)
+    return os.path.join(FAISS_LOCAL_ROOT, f"{safe_srd_id}_faiss_index_query")
+
+
+def _ensure_index_on_disk(
+    srd_id: str, local_faiss_dir: str, lambda_logger: Logger
+) -> None:
+    """Make sure the SRD's FAISS index files on local disk are current.
+
+    The S3 ``ETag`` of ``index.faiss`` is recorded in an ``.etag`` sidecar
+    next to the files, so they are only downloaded again when the index in
+    S3 has changed.
+
+    Parameters
+    ----------
+    srd_id : str
+        The SRD ID to fetch the FAISS index for.
+    local_faiss_dir : str
+        The local directory holding the index files.
+    lambda_logger : Logger
+        The logger instance to use for logging.
+    """
+    s3_index_prefix = f"{srd_id}/faiss_index"
+    etag_path = os.path.join(local_faiss_dir, ".etag")
+
+    # Compare the index's current ETag with the one already on disk
+    etag = s3_client.head_object(
+        Bucket=VECTOR_STORE_BUCKET_NAME, Key=f"{s3_index_prefix}/index.faiss"
+    )["ETag"]
+
+    # Hold an exclusive lock while checking and refreshing the files, so
+    # only one process populates a directory on a shared file system (e.g.
+    # EFS) while the others wait and then reuse its download
+    os.makedirs(local_faiss_dir, exist_ok=True)
+    with open(os.path.join(local_faiss_dir, ".lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            with open(etag_path) as etag_file:
+                if etag_file.read() == etag:
+                    lambda_logger.info(
+                        f"FAISS index for '{srd_id}' is current on local disk."
+                    )
+                    return
+        except FileNotFoundError:
+            pass
+
+        # Drop the stale sidecar first so a partial download is never reused
+        if os.path.exists(etag_path):
+            os.remove(etag_path)
+
+        # Download the required files from S3 concurrently, sharing one pool
+        # of ranged GETs between them
+        with create_transfer_manager(
+            s3_client, FAISS_TRANSFER_CONFIG
+        ) as transfer_manager:
+            downloads = []
+            for file_name in FAISS_INDEX_FILES:
+                s3_key = f"{s3_index_prefix}/{file_name}"
+                lambda_logger.info(
+                    f"Downloading s3://{VECTOR_STORE_BUCKET_NAME}/{s3_key}"
+                )
+                downloads.append(
+                    transfer_manager.download(
+                        VECTOR_STORE_BUCKET_NAME,
+                        s3_key,
+                        os.path.join(local_faiss_dir, file_name),
+                    )
+                )
+            # Surface any download error
+            for download in downloads:
+                download.result()
+
+        with open(etag_path, "w") as etag_file:
+            etag_file.write(etag)
+
+
+def _stream_faiss_index_from_s3(srd_id: str) -> tuple[Any, Any, Any, int]:
+    """Read an SRD's FAISS index from S3 straight into memory.
+
+    Used when the index cannot be kept on local disk. ``index.faiss`` is fed
+    to FAISS through a callback reader in blocks as it arrives, so it is
+    never written to the file system.
+
+    Parameters
+    ----------
+    srd_id : str
+        The SRD ID to read the FAISS index for.
+
+    Returns
+    -------
+    tuple[Any, Any, Any, int]
+        The FAISS index, its docstore, the index-to-docstore ID mapping and
+        the size of ``index.faiss`` in bytes.
+    """
     s3_index_prefix = f"{srd_id}/faiss_index"
-    safe_srd_id = "".join(
-        c if c.isalnum() or c in ["-", "_"] else "_" for c in srd_id
+    response = s3_client.get_object(
+        Bucket=VECTOR_STORE_BUCKET_NAME, Key=f"{s3_index_prefix}/index.faiss"
     )
-    local_faiss_dir = f"/tmp/{safe_srd_id}_faiss_index_query"
+    index = faiss.read_index(
+        faiss.PyCallbackIOReader(
+            response["Body"].read, FAISS_STREAM_BLOCK_SIZE
+        )
+    )
+    docstore, index_to_docstore_id = pickle.loads(
+        s3_client.get_object(
+            Bucket=VECTOR_STORE_BUCKET_NAME,
+            Key=f"{s3_index_prefix}/index.pkl",
+        )["Body"].read()
+    )
+    return index, docstore, index_to_docstore_id, response["ContentLength"]
+
+
+def _tune_faiss_index(index: Any) -> None:
+    """Set search parameters for IVF indexes built by the ingestor.
 
+    ``nprobe`` is raised to the square root of the number of inverted lists
+    (at least ``MIN_IVF_NPROBE``). Other index types are left unchanged.
+
+    Parameters
+    ----------
+    index : Any
+        The FAISS index to tune.
+    """
     try:
-        # Create local directory for FAISS index
-        if os.path.exists(local_faiss_dir):
-            shutil.rmtree(local_faiss_dir)
-        os.makedirs(local_faiss_dir, exist_ok=True)
-
-        # Download the required files from S3
-        required_files = ["index.faiss", "index.pkl"]
-        for file_name in required_files:
-            s3_key = f"{s3_index_prefix}/{file_name}"
-            local_file_path = os.path.join(local_faiss_dir, file_name)
-            lambda_logger.info(
-                f"Downloading s3://{VECTOR_STORE_BUCKET_NAME}/{s3_key} to {local_file_path}"
+        ivf_index = faiss.extract_index_ivf(index)
+    except RuntimeError:
+        return  # Not an IVF index
+    ivf_index.nprobe = max(MIN_IVF_NPROBE, math.isqrt(ivf_index.nlist))
+
+
+def _download_and_load_faiss_index(
+    srd_id: str, lambda_logger: Logger
+) -> Optional[FAISS]:
+    """Load the FAISS index for an SRD and add it to the cache.
+
+    The index is memory-mapped read-only from the local copy kept by
+    ``_ensure_index_on_disk``, so pages are read on demand instead of the
+    whole index being copied into memory. If the local copy cannot be
+    written (e.g. the disk is full), the index is streamed from S3 into
+    memory instead. Callers must hold the ``_faiss_srd_lock`` for
+    ``srd_id``.
+
+    Parameters
+    ----------
+    srd_id : str
+        The SRD ID to load the FAISS index for.
+    lambda_logger : Logger
+        The logger instance to use for logging.
+
+    Returns
+    -------
+    Optional[FAISS]
+        The loaded FAISS index, or None if loading failed.
+    """
+    local_faiss_dir = _local_faiss_dir(srd_id)
+    try:
+        try:
+            _ensure_index_on_disk(srd_id, local_faiss_dir, lambda_logger)
+        except OSError as e:
+            lambda_logger.warning(
+                f"Could not keep FAISS index for '{srd_id}' on local disk: "
+                f"{e}. Streaming it from S3 instead."
             )
-            s3_client.download_file(
-                VECTOR_STORE_BUCKET_NAME, s3_key, local_file_path
+            shutil.rmtree(local_faiss_dir, ignore_errors=True)
+            index, docstore, index_to_docstore_id, index_size = (
+                _stream_faiss_index_from_s3(srd_id)
             )
+        else:
+            # Map the index and load its docstore, as FAISS.load_local does
+            index_path = os.path.join(local_faiss_dir, "index.faiss")
+            index = faiss.read_index(
+                index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            )
+            with open(os.path.join(local_faiss_dir, "index.pkl"), "rb") as f:
+                docstore, index_to_docstore_id = pickle.load(f)
+            index_size = os.path.getsize(index_path)
+        _tune_faiss_index(index)
 
-        # Load the FAISS index from the local directory
-        vector_store = FAISS.load_local(
-            folder_path=local_faiss_dir,
-            embeddings=embedding_model,  # Uses BedrockEmbeddings
-            allow_dangerous_deserialization=True,
+        vector_store = FAISS(
+            embedding_function=embedding_model,  # Uses BedrockEmbeddings
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id=index_to_docstore_id,
         )
 
-        # Check if the vector store was loaded successfully
-        if len(faiss_index_cache) >= MAX_CACHE_SIZE:
-            oldest_key = next(iter(faiss_index_cache))
-            faiss_index_cache.pop(oldest_key)
-        faiss_index_cache[srd_id] = vector_store
+        # Cache the index, evicting the least recently used ones while the
+        # cache is over budget (the newest index is always kept)
+        with _faiss_index_lock:
+            faiss_index_cache[srd_id] = (vector_store, index_size)
+            while len(faiss_index_cache) > 1 and (
+                sum(size for _, size in faiss_index_cache.values())
+                > FAISS_CACHE_BYTES
+            ):
+                evicted_srd_id, _ = faiss_index_cache.popitem(last=False)
+                lambda_logger.info(
+                    f"Evicted FAISS index for '{evicted_srd_id}' from cache."
+                )
         return vector_store
     except Exception as e:
         lambda_logger.exception(
             f"Error loading FAISS index for '{srd_id}': {e}"
         )
+        # Drop the local copy so a bad file is not reused on the next load
+        shutil.rmtree(local_faiss_dir, ignore_errors=True)
         return None
-    finally:
-        # Clean up the local FAISS directory
-        if os.path.exists(local_faiss_dir):
-            try:
-                shutil.rmtree(local_faiss_dir)
-            except Exception:
-                pass
+
+
+def _get_cached_answer(
+    query_hash: str, lambda_logger: Logger
+) -> Optional[str]:
+    """Look up a cached LLM answer in DynamoDB.
+
+    Parameters
+    ----------
+    query_hash : str
+        The hash of the query used as the cache key.
+    lambda_logger : Logger
+        The logger instance to use for logging.
+
+    Returns
+    -------
+    Optional[str]
+        The cached answer if a valid (non-expired) entry exists, otherwise
+        None.
+    """
+    try:
+        lambda_logger.info(f"Checking cache for query_hash: {query_hash}")
+
+        # Attempt to get the cached response from DynamoDB. Only the answer
+        # and TTL are needed, and an eventually consistent read is enough.
+        response = dynamodb_client.get_item(
+            TableName=QUERY_CACHE_TABLE_NAME,
+            Key={"query_hash": {"S": query_hash}},
+            ProjectionExpression="#z, #a, #t",
+            ExpressionAttributeNames={
+                "#z": "answer_zstd",
+                "#a": "answer",
+                "#t": "ttl",
+            },
+            ConsistentRead=False,
+        )
+
+        # DynamoDB TTL deletes lazily, so re-check expiry of the item
+        item = response.get("Item", {})
+        expires_at = int(item.get("ttl", {"N": "0"})["N"])
+        if item and expires_at > time.time():
+            lambda_logger.info(f"Cache hit for query_hash: {query_hash}")
+            # Entries written before compression only have a plain answer
+            if "answer_zstd" in item:
+                return _answer_decompressor.decompress(
+                    item["answer_zstd"]["B"]
+                ).decode("utf-8")
+            return item["answer"]["S"]
+    except ClientError as e:
+        # Handle DynamoDB client errors
+        lambda_logger.warning(
+            f"DynamoDB cache get_item error: {e}. Proceeding without cache."
+        )
+    except Exception as e:
+        # Catch other potential errors like missing 'answer' or 'S'
+        lambda_logger.warning(
+            f"Error processing cache item: {e}. Proceeding without cache."
+        )
+    return None
+
+
+def _get_cached_embedding(
+    embedding_key: str, lambda_logger: Logger
+) -> Optional[list[float]]:
+    """Look up a stored query embedding in the DynamoDB query cache.
+
+    Parameters
+    ----------
+    embedding_key : str
+        The cache key of the embedding (``emb#`` prefixed).
+    lambda_logger : Logger
+        The logger instance for logging.
+
+    Returns
+    -------
+    Optional[list[float]]
+        The embedding vector, or None on a miss or error.
+    """
+    try:
+        response = dynamodb_client.get_item(
+            TableName=QUERY_CACHE_TABLE_NAME,
+            Key={"query_hash": {"S": embedding_key}},
+            ProjectionExpression="embedding",
+            ConsistentRead=False,
+        )
+        item = response.get("Item")
+        if not item or "embedding" not in item:
+            return None
+
+        # Vectors are stored as packed float32
+        vector = array.array("f")
+        vector.frombytes(item["embedding"]["B"])
+        return vector.tolist()
+    except Exception as e:
+        lambda_logger.warning(f"Error reading cached embedding: {e}.")
+        return None
+
+
+def _put_cached_embedding(
+    embedding_key: str, vector: list[float], lambda_logger: Logger
+) -> None:
+    """Store a query embedding in the DynamoDB query cache.
+
+    Runs on ``_cache_write_executor``, like ``_put_cached_answer``.
+
+    Parameters
+    ----------
+    embedding_key : str
+        The cache key of the embedding (``emb#`` prefixed).
+    vector : list[float]
+        The embedding vector to store.
+    lambda_logger : Logger
+        The logger instance for logging.
+    """
+    try:
+        dynamodb_client.put_item(
+            TableName=QUERY_CACHE_TABLE_NAME,
+            Item={
+                "query_hash": {"S": embedding_key},
+                "embedding": {"B": array.array("f", vector).tobytes()},
+                "ttl": {
+                    "N": str(int(time.time() + EMBEDDING_CACHE_TTL_SECONDS))
+                },
+            },
+        )
+    except Exception as e:
+        lambda_logger.warning(f"Error caching embedding: {e}.")
+
+
+@lru_cache(maxsize=1024)
+def _embed_query(query_text: str, lambda_logger: Logger) -> tuple[float, ...]:
+    """Embed a query, memoized in-process (L1) and in DynamoDB (L2).
+
+    The handler passes the same logger on every invocation, so including
+    it in the L1 key does not split the cache.
+
+    Parameters
+    ----------
+    query_text : str
+        The query text to embed.
+    lambda_logger : Logger
+        The logger instance for logging.
+
+    Returns
+    -------
+    tuple[float, ...]
+        The embedding vector, as a tuple so the cached value is immutable.
+    """
+    use_l2_cache = bool(QUERY_CACHE_TABLE_NAME and dynamodb_client)
+    embedding_key = (
+        "emb#"
+        + hashlib.blake2b(
+            f"{BEDROCK_EMBEDDING_MODEL_ID}-{query_text}".encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+    )
+
+    # Check the DynamoDB cache before calling Bedrock
+    if use_l2_cache:
+        cached_vector = _get_cached_embedding(embedding_key, lambda_logger)
+        if cached_vector is not None:
+            return tuple(cached_vector)
+
+    vector = embedding_model.embed_query(query_text)
+    if use_l2_cache:
+        # Store the embedding without waiting on the write
+        _cache_write_executor.submit(
+            _put_cached_embedding, embedding_key, vector, lambda_logger
+        )
+    return tuple(vector)
+
+
+def _join_truncated(parts: list[str], separator: str, limit: int) -> str:
+    """Join strings, stopping once the result reaches a length limit.
+
+    The parts are written to one buffer, and parts past the limit are
+    never copied, unlike slicing a full join.
+
+    Parameters
+    ----------
+    parts : list[str]
+        The strings to join.
+    separator : str
+        The separator placed between parts.
+    limit : int
+        The maximum length of the result.
+
+    Returns
+    -------
+    str
+        The joined string, cut to at most ``limit`` characters.
+    """
+    buffer = io.StringIO()
+    for i, part in enumerate(parts):
+        if buffer.tell() >= limit:
+            break
+        if i:
+            buffer.write(separator)
+        buffer.write(part)
+    return buffer.getvalue()[:limit]
+
+
+def _put_cached_answer(item: Dict[str, Any], lambda_logger: Logger) -> None:
+    """Store a generated answer in the DynamoDB query cache.
+
+    The item is written with a conditional ``update_item`` that only
+    succeeds when there is no live entry for the query, so a concurrent
+    request that already cached the answer is not overwritten.
+
+    Runs on ``_cache_write_executor``. A write still pending when the
+    execution environment shuts down is lost, which is fine for a cache.
+
+    Parameters
+    ----------
+    item : Dict[str, Any]
+        The DynamoDB item to store.
+    lambda_logger : Logger
+        The logger instance for logging.
+    """
+    query_hash = item["query_hash"]["S"]
+
+    # Set every attribute but the key, through placeholders since names
+    # like "ttl" and "timestamp" are reserved words
+    attributes = [name for name in item if name != "query_hash"]
+    attribute_names = {"#ttl": "ttl"}
+    attribute_values = {":now": {"N": str(int(time.time()))}}
+    assignments = []
+    for i, name in enumerate(attributes):
+        attribute_names[f"#a{i}"] = name
+        attribute_values[f":v{i}"] = item[name]
+        assignments.append(f"#a{i} = :v{i}")
+
+    try:
+        dynamodb_client.update_item(
+            TableName=QUERY_CACHE_TABLE_NAME,
+            Key={"query_hash": {"S": query_hash}},
+            UpdateExpression="SET " + ", ".join(assignments),
+            ConditionExpression=(
+                "attribute_not_exists(query_hash) OR #ttl < :now"
+            ),
+            ExpressionAttributeNames=attribute_names,
+            ExpressionAttributeValues=attribute_values,
+            ReturnValues="NONE",
+            ReturnConsumedCapacity="NONE",
+        )
+        lambda_logger.info(
+            f"Bedrock response cached for query_hash: {query_hash}"
+        )
+    # Catch DynamoDB client errors
+    except ClientError as e:
+        if (
+            e.response.get("Error", {}).get("Code")
+            == "ConditionalCheckFailedException"
+        ):
+            lambda_logger.info(
+                f"Response already cached for query_hash: {query_hash}"
+            )
+            return
+        lambda_logger.warning(
+            f"DynamoDB cache update_item error: {e}. Response not cached."
+        )
+    # Nothing awaits the write, so log anything else instead of losing it
+    except Exception as e:
+        lambda_logger.warning(
+            f"Error caching response: {e}. Response not cached."
+        )
 
 
 def get_answer_from_rag(
@@ -313,46 +946,28 @@ def get_answer_from_rag(
             "QUERY_CACHE_TABLE_NAME not set; Bedrock LLM response caching will be disabled."
         )
 
-    # Generate a cache key
+    # Generate a 128-bit cache key
     cache_key_string = f"{srd_id}-{query_text}-{invoke_generative_llm}"
-    query_hash = hashlib.md5(cache_key_string.encode()).hexdigest()
+    query_hash = hashlib.blake2b(
+        cache_key_string.encode("utf-8"), digest_size=16
+    ).hexdigest()
 
-    # 1. Check cache if invoking LLM and cache is configured
-    if invoke_generative_llm and QUERY_CACHE_TABLE_NAME and dynamodb_client:
-        try:
-            lambda_logger.info(f"Checking cache for query_hash: {query_hash}")
-
-            # Attempt to get the cached response from DynamoDB
-            response = dynamodb_client.get_item(
-                TableName=QUERY_CACHE_TABLE_NAME,
-                Key={"query_hash": {"S": query_hash}},
-            )
+    # 1. Start loading the FAISS index so it overlaps with the cache lookup
+    index_future = _io_executor.submit(
+        _load_faiss_index_from_s3, srd_id, lambda_logger
+    )
 
-            # Check if the item exists and is still valid (TTL)
-            if (
-                "Item" in response
-                and int(response["Item"].get("ttl", {"N": "0"})["N"])
-                > time.time()
-            ):
-                # Return the cached answer if it exists
-                lambda_logger.info(f"Cache hit for query_hash: {query_hash}")
-                return {
-                    "answer": response["Item"]["answer"]["S"],
-                    "source": "cache",
-                }
-        except ClientError as e:
-            # Handle DynamoDB client errors
-            lambda_logger.warning(
-                f"DynamoDB cache get_item error: {e}. Proceeding without cache."
-            )
-        except Exception as e:
-            # Catch other potential errors like missing 'answer' or 'S'
-            lambda_logger.warning(
-                f"Error processing cache item: {e}. Proceeding without cache."
-            )
+    # 2. Check cache if invoking LLM and cache is configured
+    if invoke_generative_llm and QUERY_CACHE_TABLE_NAME and dynamodb_client:
+        cached_answer = _get_cached_answer(query_hash, lambda_logger)
+        if cached_answer is not None:
+            # Drop the load if it has not started; a running load still
+            # finishes in the background and warms the index cache.
+            index_future.cancel()
+            return {"answer": cached_answer, "source": "cache"}
 
-    # 2. Load the FAISS index from S3
-    vector_store = _load_faiss_index_from_s3(srd_id, lambda_logger)
+    # Wait for the FAISS index load to complete
+    vector_store = index_future.result()
     if not vector_store:
         return {"error": f"Could not load SRD data for '{srd_id}'."}
 
@@ -361,12 +976,13 @@ def get_answer_from_rag(
         f"Performing similarity search for query: '{query_text}'"
     )
     try:
-        # The retriever will fetch relevant documents.
-        retriever = vector_store.as_retriever(
-            search_kwargs={"k": 4}  # Retrieve top 4 docs
+        # Embed the raw query once; both answer paths share the results
+        query_vector = list(_embed_query(query_text, lambda_logger))
+        docs = vector_store.similarity_search_by_vector(
+            query_vector, k=RETRIEVAL_K
         )
     except Exception as e:
-        lambda_logger.exception(f"Error creating retriever: {e}")
+        lambda_logger.exception(f"Error during similarity search: {e}")
         return {"error": "Failed to prepare for information retrieval."}
 
     # Handle conversational style for the query text
@@ -382,7 +998,6 @@ def get_answer_from_rag(
         lambda_logger.info(
             "Generative LLM not invoked by client request. Returning retrieved context."
         )
-        docs = retriever.invoke(query_text)  # Langchain 0.2.x uses invoke
 
         # Check if no documents were retrieved
         if not docs:
@@ -393,8 +1008,14 @@ def get_answer_from_rag(
                 "source": "retrieval_only",
             }
 
-        # Format the retrieved documents into a string
-        context_str = "\n\n---\n\n".join([doc.page_content for doc in docs])
+        # Format the retrieved documents into a string, writing each chunk
+        # to one buffer instead of collecting them in a list first
+        context_buffer = io.StringIO()
+        for i, doc in enumerate(docs):
+            if i:
+                context_buffer.write("\n\n---\n\n")
+            context_buffer.write(doc.page_content)
+        context_str = context_buffer.getvalue()
         formatted_answer = f"Based on the retrieved SRD content for your query '{query_text}':\n{context_str}"
         return {"answer": formatted_answer, "source": "retrieval_only"}
 
@@ -410,91 +1031,55 @@ def get_answer_from_rag(
             )
         }
 
-    # Define the prompt template for the generative LLM
-    # This prompt template is crucial for guiding the LLM's response.
-    prompt_template_str = """You are 'Arcane Scribe', a helpful TTRPG assistant.
-Based *only* on the following context from the System Reference Document (SRD), provide a concise and direct answer to the question.
-If the question (which might be formatted as 'User: ... Bot:') asks for advice, optimization (e.g., "min-max"), or creative ideas, you may synthesize or infer suggestions *grounded in the provided SRD context*.
-Do not introduce rules, abilities, or concepts not present in or directly supported by the context.
-If the context does not provide enough information for a comprehensive answer or suggestion, state that clearly.
-Always be helpful and aim to directly address the user's intent.
-If the question is not formatted as 'User: ... Bot:', you may assume it is a direct question and respond accordingly.
-
-Context:
-{context}
-
-Question: {question}
-
-Helpful Answer:"""
-
-    # Create a PromptTemplate instance with the defined template
-    PROMPT = PromptTemplate(
-        template=prompt_template_str, input_variables=["context", "question"]
+    # Stuff the retrieved chunks into the prompt ("stuff" strategy; ensure
+    # it fits the model context window)
+    source_docs_content = [doc.page_content for doc in docs]
+    prompt = PROMPT.format(
+        context="\n\n".join(source_docs_content), question=final_query_text
     )
 
-    # Create a RetrievalQA chain. This chain will:
-    #  1. Use the 'retriever' to fetch documents.
-    #  2. Stuff them into the 'PROMPT'.
-    #  3. Send that to the 'llm' (ChatBedrock).
-    qa_chain = RetrievalQA.from_chain_type(
-        llm=current_llm_instance,  # Use dynamically configured LLM
-        chain_type="stuff",  # "stuff" is good for short contexts, ensure it fits model context window
-        retriever=retriever,
-        chain_type_kwargs={"prompt": PROMPT},
-        return_source_documents=True,  # Optionally return source documents
-    )
-
-    # Invoke the RAG chain with the query text
+    # Invoke the Bedrock LLM with the assembled prompt
     lambda_logger.info(
         f"Invoking RAG chain with Bedrock LLM for query: '{final_query_text}'"
     )
     try:
-        # The 'query' key for invoke should contain what the {question} placeholder in PROMPT expects
-        result = qa_chain.invoke(
-            {"query": final_query_text}
-        )  # Langchain 0.2.x uses invoke
-        answer = result.get("result", "No answer generated.")
-        source_docs_content = [
-            doc.page_content for doc in result.get("source_documents", [])
-        ]
-
-        # Cache the successful Bedrock response
-        if (
-            QUERY_CACHE_TABLE_NAME
-            and dynamodb_client
-            and answer != "No answer generated."
-        ):
-            try:
-                # Store the response in DynamoDB cache
-                ttl_value = int(time.time() + CACHE_TTL_SECONDS)
-                dynamodb_client.put_item(
-                    TableName=QUERY_CACHE_TABLE_NAME,
-                    Item={
-                        "query_hash": {"S": query_hash},
-                        "answer": {"S": answer},
-                        "srd_id": {"S": srd_id},
-                        "query_text": {"S": query_text},
-                        "source_documents_summary": {
-                            "S": ("; ".join(source_docs_content))[:1000]
-                        },
-                        "timestamp": {"S": str(time.time())},
-                        "ttl": {"N": str(ttl_value)},
-                        "generation_config_used": {
-                            "S": json.dumps(generation_config_payload)
-                        },
-                        "was_conversational": {
-                            "BOOL": use_conversational_style
-                        },
+        response = current_llm_instance.invoke(prompt)
+        answer = response.content or NO_ANSWER
+
+        # Cache the Bedrock response. Empty answers are cached too, but only
+        # briefly, so repeats of an unanswerable query skip the LLM call.
+        if QUERY_CACHE_TABLE_NAME and dynamodb_client:
+            # Store the response in DynamoDB cache without waiting on it
+            negative = answer == NO_ANSWER
+            ttl_seconds = (
+                NEGATIVE_CACHE_TTL_SECONDS if negative else CACHE_TTL_SECONDS
+            )
+            now = time.time()  # One clock read for the timestamp and TTL
+            ttl_value = int(now + ttl_seconds)
+            _cache_write_executor.submit(
+                _put_cached_answer,
+                {
+                    "query_hash": {"S": query_hash},
+                    "answer_zstd": {
+                        "B": _answer_compressor.compress(
+                            answer.encode("utf-8")
+                        )
                     },
-                )
-                lambda_logger.info(
-                    f"Bedrock response cached for query_hash: {query_hash}"
-                )
-            # Catch DynamoDB client errors
-            except ClientError as e:
-                lambda_logger.warning(
-                    f"DynamoDB cache put_item error: {e}. Response not cached."
-                )
+                    "srd_id": {"S": srd_id},
+                    "query_text": {"S": query_text},
+                    "source_documents_summary": {
+                        "S": _join_truncated(source_docs_content, "; ", 1000)
+                    },
+                    "timestamp": {"S": str(now)},
+                    "ttl": {"N": str(ttl_value)},
+                    "generation_config_used": {
+                        "S": json.dumps(generation_config_payload)
+                    },
+                    "was_conversational": {"BOOL": use_conversational_style},
+                    "negative": {"BOOL": negative},
+                },
+                lambda_logger,
+            )
 
         # Return the answer and source documents
         lambda_logger.info(
@@ -519,3 +1104,10 @@ Helpful Answer:"""
     except Exception as e:
         lambda_logger.exception(f"Error during RAG chain execution: {e}")
         return {"error": "Failed to generate an answer using the RAG chain."}
+
+
+# Warm the FAISS index cache in the background while the first request
+# is still on its way
+if PREFETCH_SRD_ID and embedding_model:
+    logger.info(f"Prefetching FAISS index for '{PREFETCH_SRD_ID}'.")
+    _io_executor.submit(_load_faiss_index_from_s3, PREFETCH_SRD_ID, logger)
@@ -2,6 +2,7 @@
 import os
 import sys
 import importlib.util
+from functools import lru_cache
 from pathlib import Path
 from types import ModuleType
 
@@ -118,10 +119,12 @@ def pytest_configure(config):
     return config
 
 
+@lru_cache(maxsize=None)
 def import_handler(module_name: str) -> ModuleType:
     """
     Import a handler.py module from a src subdirectory, even when the directory
-    name contains hyphens that prevent normal Python imports.
+    name contains hyphens that prevent normal Python imports. Each handler is
+    only imported once per test session.
 
     Parameters
     ----------
@@ -1,6 +1,6 @@
 # Standard Library
-from typing import Generator, Any, Dict
-from unittest.mock import MagicMock, patch
+from types import ModuleType, SimpleNamespace
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
 
 # Third Party
 import pytest
@@ -9,274 +9,251 @@ import pytest
 from tests.conftest import import_handler
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def handler_module():
     """Import and return the as-authorizer handler module."""
     return import_handler("as-authorizer")
 
 
 @pytest.fixture
-def mock_logger(handler_module: MagicMock) -> Generator[MagicMock, None, None]:
-    """Mock the logger instance in the handler."""
-    with patch.object(handler_module, "logger") as mock_log:
-        yield mock_log
+def set_handler_config(
+    handler_module: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> Callable[..., None]:
+    """Set handler module attributes, restoring them after the test."""
 
+    def _set_handler_config(**config: Any) -> None:
+        for name, value in config.items():
+            monkeypatch.setattr(handler_module, name, value)
 
-@pytest.fixture
-def sample_lambda_context() -> MagicMock:
-    """Return a sample Lambda context object."""
-    context = MagicMock()
-    context.function_name = "test_authorizer_lambda"
-    context.memory_limit_in_mb = 256
-    context.aws_request_id = "test-authorizer-request-id"
-    context.invoked_function_arn = (
-        "arn:aws:lambda:us-east-1:123456789012:function:test_authorizer"
-    )
-    return context
+    return _set_handler_config
 
 
-@pytest.fixture
-def sample_api_gateway_event() -> Dict[str, Any]:
-    """Return a sample API Gateway HTTP API event."""
-    return {
-        "version": "2.0",
-        "type": "REQUEST",
-        "routeArn": "arn:aws:execute-api:us-east-1:123456789012:abcdef123/test/GET/resource",
-        "identitySource": ["$request.header.Authorization"],
-        "routeKey": "GET /resource",
-        "rawPath": "/resource",
-        "rawQueryString": "",
-        "headers": {
-            "accept": "application/json",
-            "content-length": "0",
-            "host": "api.example.com",
-            "user-agent": "test-client/1.0",
-        },
-        "requestContext": {
-            "accountId": "123456789012",
-            "apiId": "abcdef123",
-            "domainName": "api.example.com",
-            "http": {
-                "method": "GET",
-                "path": "/resource",
-                "protocol": "HTTP/1.1",
-                "sourceIp": "192.168.1.1",
-                "userAgent": "test-client/1.0",
-            },
-            "requestId": "test-request-id",
-            "routeKey": "GET /resource",
-            "stage": "test",
-            "time": "01/Jan/2023:12:00:00 +0000",
-            "timeEpoch": 1672574400000,
-        },
-    }
+class RecordingLogger:
+    """Stand-in for the handler's logger that records each log call."""
 
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, str, Dict[str, Any]]] = []
 
-class TestAuthorizerHandler:
-    """Test class for the authorizer handler."""
+    def info(self, message: str, **kwargs: Any) -> None:
+        self.calls.append(("info", message, kwargs))
 
-    def test_lambda_handler_success_authorization(
-        self,
-        handler_module: MagicMock,
-        mock_logger: MagicMock,
-        sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
-    ):
-        """Test successful authorization with correct header."""
-        with patch.multiple(
-            handler_module,
-            EXPECTED_HEADER_NAME_CONFIG="x-api-key",
-            EXPECTED_HEADER_VALUE="valid-secret-key",
-        ):
-            # Add the expected header to the event
-            sample_api_gateway_event["headers"][
-                "x-api-key"
-            ] = "valid-secret-key"
-
-            result = handler_module.lambda_handler(
-                sample_api_gateway_event, sample_lambda_context
-            )
-
-            assert result == {"isAuthorized": True}
-            mock_logger.info.assert_any_call(
-                "Authorizer invoked.",
-                extra={
-                    "route_arn": "arn:aws:execute-api:us-east-1:123456789012:abcdef123/test/GET/resource"
-                },
-            )
-            mock_logger.info.assert_any_call(
-                "Authorization successful for header: x-api-key"
-            )
-
-    def test_lambda_handler_success_case_insensitive_header(
-        self,
-        handler_module: MagicMock,
-        mock_logger: MagicMock,
-        sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
-    ):
-        """Test successful authorization with case-insensitive header names."""
-        with patch.multiple(
-            handler_module,
-            EXPECTED_HEADER_NAME_CONFIG="x-api-key",
-            EXPECTED_HEADER_VALUE="valid-secret-key",
-        ):
-            # Add header with different case
-            sample_api_gateway_event["headers"][
-                "X-API-KEY"
-            ] = "valid-secret-key"
-
-            result = handler_module.lambda_handler(
-                sample_api_gateway_event, sample_lambda_context
-            )
-
-            assert result == {"isAuthorized": True}
-            mock_logger.info.assert_any_call(
-                "Authorization successful for header: x-api-key"
-            )
-
-    def test_lambda_handler_denied_missing_header(
-        self,
-        handler_module: MagicMock,
-        mock_logger: MagicMock,
-        sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
-    ):
-        """Test authorization denied when required header is missing."""
-        with patch.multiple(
-            handler_module,
-            EXPECTED_HEADER_NAME_CONFIG="x-api-key",
-            EXPECTED_HEADER_VALUE="valid-secret-key",
-        ):
-            # Don't add the expected header
+    def warning(self, message: str, **kwargs: Any) -> None:
+        self.calls.append(("warning", message, kwargs))
 
-            result = handler_module.lambda_handler(
-                sample_api_gateway_event, sample_lambda_context
-            )
+    def error(self, message: str, **kwargs: Any) -> None:
+        self.calls.append(("error", message, kwargs))
 
-            assert result == {"isAuthorized": False}
-            mock_logger.warning.assert_called_once_with(
-                "Authorization denied. Missing required header: x-api-key"
-            )
 
-    def test_lambda_handler_denied_invalid_header_value(
-        self,
-        handler_module: MagicMock,
-        mock_logger: MagicMock,
-        sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
-    ):
-        """Test authorization denied when header value is invalid."""
-        with patch.multiple(
-            handler_module,
-            EXPECTED_HEADER_NAME_CONFIG="x-api-key",
-            EXPECTED_HEADER_VALUE="valid-secret-key",
-        ):
-            # Add header with wrong value
-            sample_api_gateway_event["headers"]["x-api-key"] = "invalid-key"
+@pytest.fixture(scope="session")
+def recording_logger(
+    handler_module: ModuleType,
+) -> Generator[RecordingLogger, None, None]:
+    """Replace the logger instance in the handler with a recorder."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        recorder = RecordingLogger()
+        monkeypatch.setattr(handler_module, "logger", recorder)
+        yield recorder
 
-            result = handler_module.lambda_handler(
-                sample_api_gateway_event, sample_lambda_context
-            )
 
-            assert result == {"isAuthorized": False}
-            mock_logger.warning.assert_called_once_with(
-                "Authorization denied. Invalid value for header: x-api-key"
-            )
+@pytest.fixture
+def mock_logger(recording_logger: RecordingLogger) -> RecordingLogger:
+    """Return the handler's recording logger, cleared for this test."""
+    recording_logger.calls.clear()
+    return recording_logger
 
-    def test_lambda_handler_denied_missing_env_header_name(
-        self,
-        handler_module: MagicMock,
-        mock_logger: MagicMock,
-        sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
-    ):
-        """Test authorization denied when header name env var is missing."""
-        with patch.multiple(
-            handler_module,
-            EXPECTED_HEADER_NAME_CONFIG="",
-            EXPECTED_HEADER_VALUE="valid-secret-key",
-        ):
-            result = handler_module.lambda_handler(
-                sample_api_gateway_event, sample_lambda_context
-            )
 
-            assert result == {"isAuthorized": False}
-            mock_logger.error.assert_called_once_with(
-                "Authorizer is misconfigured (missing env vars). Denying request."
-            )
+@pytest.fixture(scope="session")
+def sample_lambda_context() -> SimpleNamespace:
+    """Return a sample Lambda context object."""
+    return SimpleNamespace(
+        function_name="test_authorizer_lambda",
+        memory_limit_in_mb=256,
+        aws_request_id="test-authorizer-request-id",
+        invoked_function_arn=(
+            "arn:aws:lambda:us-east-1:123456789012:function:test_authorizer"
+        ),
+    )
+
 
-    def test_lambda_handler_denied_missing_env_header_value(
+ROUTE_ARN = (
+    "arn:aws:execute-api:us-east-1:123456789012:abcdef123/test/GET/resource"
+)
+# Expected extra fields of the "Authorizer invoked." log
+INVOKED_EXTRA = {"extra": {"route_arn": ROUTE_ARN}}
+
+# Sample API Gateway HTTP API event, shared read-only between tests
+SAMPLE_API_GATEWAY_EVENT: Dict[str, Any] = {
+    "version": "2.0",
+    "type": "REQUEST",
+    "routeArn": ROUTE_ARN,
+    "identitySource": ["$request.header.Authorization"],
+    "routeKey": "GET /resource",
+    "rawPath": "/resource",
+    "rawQueryString": "",
+    "headers": {
+        "accept": "application/json",
+        "content-length": "0",
+        "host": "api.example.com",
+        "user-agent": "test-client/1.0",
+    },
+    "requestContext": {
+        "accountId": "123456789012",
+        "apiId": "abcdef123",
+        "domainName": "api.example.com",
+        "http": {
+            "method": "GET",
+            "path": "/resource",
+            "protocol": "HTTP/1.1",
+            "sourceIp": "192.168.1.1",
+            "userAgent": "test-client/1.0",
+        },
+        "requestId": "test-request-id",
+        "routeKey": "GET /resource",
+        "stage": "test",
+        "time": "01/Jan/2023:12:00:00 +0000",
+        "timeEpoch": 1672574400000,
+    },
+}
+
+# Minimal events for the missing-field cases; the handler never modifies
+# the event, so these are shared as-is
+EVENT_WITHOUT_HEADERS: Dict[str, Any] = {"routeArn": ROUTE_ARN}
+EVENT_WITHOUT_ROUTE_ARN: Dict[str, Any] = {
+    "headers": {"x-api-key": "valid-secret-key"}
+}
+
+
+@pytest.fixture
+def sample_api_gateway_event() -> Dict[str, Any]:
+    """Return a sample API Gateway HTTP API event."""
+    # Tests only modify the headers, so only they are copied
+    event = SAMPLE_API_GATEWAY_EVENT.copy()
+    event["headers"] = SAMPLE_API_GATEWAY_EVENT["headers"].copy()
+    return event
+
+
+class TestAuthorizerHandler:
+    """Test class for the authorizer handler."""
+
+    @pytest.mark.parametrize(
+        "header_name_config,header_value_config,request_headers,"
+        "should_authorize,log_level,log_message",
+        [
+            pytest.param(
+                "x-api-key",
+                "valid-secret-key",
+                {"x-api-key": "valid-secret-key"},
+                True,
+                "info",
+                "Authorization successful for header: x-api-key",
+                id="success",
+            ),
+            pytest.param(
+                "x-api-key",
+                "valid-secret-key",
+                {"X-API-KEY": "valid-secret-key"},
+                True,
+                "info",
+                "Authorization successful for header: x-api-key",
+                id="success-case-insensitive",
+            ),
+            pytest.param(
+                "x-api-key",
+                "valid-secret-key",
+                {},
+                False,
+                "warning",
+                "Authorization denied. Missing required header: x-api-key",
+                id="denied-missing-header",
+            ),
+            pytest.param(
+                "x-api-key",
+                "valid-secret-key",
+                {"x-api-key": "invalid-key"},
+                False,
+                "warning",
+                "Authorization denied. Invalid value for header: x-api-key",
+                id="denied-invalid-header-value",
+            ),
+            pytest.param(
+                "",
+                "valid-secret-key",
+                {},
+                False,
+                "error",
+                "Authorizer is misconfigured (missing env vars). "
+                "Denying request.",
+                id="denied-missing-env-header-name",
+            ),
+            pytest.param(
+                "x-api-key",
+                None,
+                {},
+                False,
+                "error",
+                "Authorizer is misconfigured (missing env vars). "
+                "Denying request.",
+                id="denied-missing-env-header-value",
+            ),
+        ],
+    )
+    def test_authorize(
         self,
-        handler_module: MagicMock,
-        mock_logger: MagicMock,
+        handler_module: ModuleType,
+        mock_logger: RecordingLogger,
         sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
+        header_name_config: str,
+        header_value_config: Optional[str],
+        request_headers: Dict[str, str],
+        should_authorize: bool,
+        log_level: str,
+        log_message: str,
     ):
-        """Test authorization denied when header value env var is missing."""
-        with patch.multiple(
-            handler_module,
-            EXPECTED_HEADER_NAME_CONFIG="x-api-key",
-            EXPECTED_HEADER_VALUE=None,
-        ):
-            result = handler_module.lambda_handler(
-                sample_api_gateway_event, sample_lambda_context
-            )
-
-            assert result == {"isAuthorized": False}
-            mock_logger.error.assert_called_once_with(
-                "Authorizer is misconfigured (missing env vars). Denying request."
-            )
-
-    def test_lambda_handler_empty_headers(
-        self,
-        handler_module: MagicMock,
-        mock_logger: MagicMock,
-        sample_lambda_context: MagicMock,
+        """Test the authorization decision and its log message."""
+        sample_api_gateway_event["headers"].update(request_headers)
+
+        result = handler_module._authorize(
+            sample_api_gateway_event, header_name_config, header_value_config
+        )
+
+        assert result == {"isAuthorized": should_authorize}
+        # The handler logs the invocation, then its decision
+        assert mock_logger.calls == [
+            ("info", "Authorizer invoked.", INVOKED_EXTRA),
+            (log_level, log_message, {}),
+        ]
+
+    def test_authorize_empty_headers(
+        self, handler_module: ModuleType, mock_logger: RecordingLogger
     ):
         """Test authorization with event that has no headers."""
-        with patch.multiple(
-            handler_module,
-            EXPECTED_HEADER_NAME_CONFIG="x-api-key",
-            EXPECTED_HEADER_VALUE="valid-secret-key",
-        ):
-            event_without_headers = {
-                "routeArn": "arn:aws:execute-api:us-east-1:123456789012:abcdef123/test/GET/resource"
-            }
-
-            result = handler_module.lambda_handler(
-                event_without_headers, sample_lambda_context
-            )
+        result = handler_module._authorize(
+            EVENT_WITHOUT_HEADERS, "x-api-key", "valid-secret-key"
+        )
 
-            assert result == {"isAuthorized": False}
-            mock_logger.warning.assert_called_once_with(
-                "Authorization denied. Missing required header: x-api-key"
-            )
+        assert result == {"isAuthorized": False}
+        assert mock_logger.calls == [
+            ("info", "Authorizer invoked.", INVOKED_EXTRA),
+            (
+                "warning",
+                "Authorization denied. Missing required header: x-api-key",
+                {},
+            ),
+        ]
 
-    def test_lambda_handler_missing_route_arn(
-        self,
-        handler_module: MagicMock,
-        mock_logger: MagicMock,
-        sample_lambda_context: MagicMock,
+    def test_authorize_missing_route_arn(
+        self, handler_module: ModuleType, mock_logger: RecordingLogger
     ):
         """Test authorization with event that has no routeArn."""
-        with patch.multiple(
-            handler_module,
-            EXPECTED_HEADER_NAME_CONFIG="x-api-key",
-            EXPECTED_HEADER_VALUE="valid-secret-key",
-        ):
-            event_without_route_arn = {
-                "headers": {"x-api-key": "valid-secret-key"}
-            }
+        result = handler_module._authorize(
+            EVENT_WITHOUT_ROUTE_ARN, "x-api-key", "valid-secret-key"
+        )
 
-            result = handler_module.lambda_handler(
-                event_without_route_arn, sample_lambda_context
-            )
-
-            assert result == {"isAuthorized": True}
-            mock_logger.info.assert_any_call(
-                "Authorizer invoked.", extra={"route_arn": None}
-            )
+        assert result == {"isAuthorized": True}
+        assert mock_logger.calls == [
+            ("info", "Authorizer invoked.", {"extra": {"route_arn": None}}),
+            ("info", "Authorization successful for header: x-api-key", {}),
+        ]
 
     @pytest.mark.parametrize(
         "header_name,header_value,expected_header_config,expected_value,should_authorize",
@@ -294,13 +271,20 @@ class TestAuthorizerHandler:
             ("x-api-key", "wrong", "x-api-key", "secret123", False),
             ("wrong-header", "secret123", "x-api-key", "secret123", False),
         ],
+        ids=[
+            "exact-match",
+            "case-insensitive",
+            "authorization-bearer",
+            "custom-auth",
+            "wrong-value",
+            "wrong-header-name",
+        ],
     )
-    def test_lambda_handler_parametrized_authorization(
+    def test_authorize_parametrized(
         self,
-        handler_module: MagicMock,
-        mock_logger: MagicMock,
+        handler_module: ModuleType,
+        mock_logger: RecordingLogger,
         sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
         header_name: str,
         header_value: str,
         expected_header_config: str,
@@ -308,41 +292,43 @@ class TestAuthorizerHandler:
         should_authorize: bool,
     ):
         """Test various authorization scenarios with parameterized inputs."""
-        with patch.multiple(
-            handler_module,
-            EXPECTED_HEADER_NAME_CONFIG=expected_header_config,
-            EXPECTED_HEADER_VALUE=expected_value,
-        ):
-            sample_api_gateway_event["headers"][header_name] = header_value
+        sample_api_gateway_event["headers"][header_name] = header_value
 
-            result = handler_module.lambda_handler(
-                sample_api_gateway_event, sample_lambda_context
-            )
+        result = handler_module._authorize(
+            sample_api_gateway_event, expected_header_config, expected_value
+        )
 
-            assert result == {"isAuthorized": should_authorize}
+        assert result == {"isAuthorized": should_authorize}
 
-    def test_lambda_handler_logging_context_injection(
+    def test_lambda_handler_uses_configured_header(
         self,
-        handler_module: MagicMock,
+        handler_module: ModuleType,
+        set_handler_config: Callable[..., None],
+        mock_logger: RecordingLogger,
         sample_api_gateway_event: Dict[str, Any],
-        sample_lambda_context: MagicMock,
+        sample_lambda_context: SimpleNamespace,
     ):
-        """Test that the lambda_handler has proper logging context injection."""
-        with patch.multiple(
-            handler_module,
+        """Test that the handler checks the header configured at start."""
+        set_handler_config(
             EXPECTED_HEADER_NAME_CONFIG="x-api-key",
             EXPECTED_HEADER_VALUE="valid-secret-key",
-        ):
-            # This test verifies the decorators are applied correctly
-            handler_func = handler_module.lambda_handler
+        )
+        sample_api_gateway_event["headers"]["x-api-key"] = "valid-secret-key"
 
-            # Check if the function has the inject_lambda_context decorator
-            assert hasattr(handler_func, "__wrapped__")
+        result = handler_module.lambda_handler(
+            sample_api_gateway_event, sample_lambda_context
+        )
 
-            # The actual behavior testing is covered in other tests
-            result = handler_module.lambda_handler(
-                sample_api_gateway_event, sample_lambda_context
-            )
+        assert result == {"isAuthorized": True}
+        assert mock_logger.calls[-1] == (
+            "info",
+            "Authorization successful for header: x-api-key",
+            {},
+        )
 
-            assert "isAuthorized" in result
-            assert isinstance(result["isAuthorized"], bool)
+    def test_lambda_handler_logging_context_injection(
+        self, handler_module: ModuleType
+    ):
+        """Test that the lambda_handler has proper logging context injection."""
+        # The inject_lambda_context decorator wraps the handler function
+        assert hasattr(handler_module.lambda_handler, "__wrapped__")
@@ -1,8 +1,9 @@
 """Unit tests for the PDF ingestor handler module."""
 
 # Standard Library
+import copy
 from typing import Generator, Any, Dict
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, call
 
 # Third Party
 import pytest
@@ -12,36 +13,65 @@ from aws_lambda_powertools.utilities.data_classes import S3Event
 from tests.conftest import import_handler
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def handler_module():
     """Import and return the as-pdf-ingestor handler module."""
     return import_handler("as-pdf-ingestor")
 
 
-@pytest.fixture
-def mock_processor(
+@pytest.fixture(scope="session")
+def installed_processor(
+    handler_module: MagicMock,
+) -> Generator[MagicMock, None, None]:
+    """Replace the handler's processor module with a mock once."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        processor_mock = MagicMock()
+        monkeypatch.setattr(handler_module, "processor", processor_mock)
+        yield processor_mock
+
+
+@pytest.fixture(scope="session")
+def installed_logger(
     handler_module: MagicMock,
 ) -> Generator[MagicMock, None, None]:
-    """Mock the processor module used by the handler."""
-    with patch.object(handler_module, "processor") as mock_processor_instance:
-        mock_processor_instance.process_s3_object.return_value = {
-            "status": "success",
-            "message": "PDF processed successfully",
-        }
-        yield mock_processor_instance
+    """Replace the handler's logger instance with a mock once."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        logger_mock = MagicMock()
+        monkeypatch.setattr(handler_module, "logger", logger_mock)
+        yield logger_mock
 
 
 @pytest.fixture
-def mock_logger(handler_module: MagicMock) -> Generator[MagicMock, None, None]:
-    """Mock the logger instance in the handler."""
-    with patch.object(handler_module, "logger") as mock_log:
-        yield mock_log
+def mock_processor(installed_processor: MagicMock) -> MagicMock:
+    """Return the mocked processor module, reset for this test."""
+    installed_processor.reset_mock(return_value=True, side_effect=True)
+    installed_processor.process_s3_object.return_value = {
+        "status": "success",
+        "message": "PDF processed successfully",
+    }
+    return installed_processor
 
 
 @pytest.fixture
-def sample_lambda_context() -> MagicMock:
+def mock_logger(installed_logger: MagicMock) -> MagicMock:
+    """Return the mocked logger instance, reset for this test."""
+    installed_logger.reset_mock()
+    return installed_logger
+
+
+# The only context attributes the handler and its logger read
+LAMBDA_CONTEXT_ATTRIBUTES = [
+    "function_name",
+    "memory_limit_in_mb",
+    "aws_request_id",
+    "invoked_function_arn",
+]
+
+
+@pytest.fixture(scope="session")
+def sample_lambda_context() -> Mock:
     """Return a sample Lambda context object."""
-    context = MagicMock()
+    context = Mock(spec=LAMBDA_CONTEXT_ATTRIBUTES)
     context.function_name = "test_pdf_ingestor_lambda"
     context.memory_limit_in_mb = 512
     context.aws_request_id = "test-pdf-ingestor-request-id"
@@ -51,41 +81,97 @@ def sample_lambda_context() -> MagicMock:
     return context
 
 
-@pytest.fixture
+# Bucket and key of the object in the sample S3 event
+BUCKET_NAME = "test-documents-bucket"
+SAMPLE_OBJECT_KEY = "documents/test_document.pdf"
+
+# Messages the handler logs at the start and end of every invocation
+TRIGGERED_MESSAGE = "PDF ingestion Lambda triggered."
+LOOP_COMPLETED_MESSAGE = (
+    "PDF ingestion processing loop completed for all records in the event."
+)
+
+# Expected extra fields of the record log for the sample S3 event
+SAMPLE_RECORD_LOG_EXTRA: Dict[str, Any] = {
+    "event_name": "ObjectCreated:Put",
+    "event_time": "2023-01-01T12:00:00.000Z",
+    "bucket_name": BUCKET_NAME,
+    "object_key": SAMPLE_OBJECT_KEY,
+    "object_version_id": "test-version-id",
+    "object_size": 1024,
+}
+
+# S3 "ObjectCreated:Put" record that make_record fills in per test
+BASE_RECORD: Dict[str, Any] = {
+    "eventVersion": "2.1",
+    "eventSource": "aws:s3",
+    "awsRegion": "us-east-1",
+    "eventTime": "2023-01-01T12:00:00.000Z",
+    "eventName": "ObjectCreated:Put",
+    "s3": {
+        "s3SchemaVersion": "1.0",
+        "configurationId": "test-config",
+        "bucket": {
+            "name": BUCKET_NAME,
+            "ownerIdentity": {"principalId": "test-principal"},
+            "arn": f"arn:aws:s3:::{BUCKET_NAME}",
+        },
+        "object": {
+            "key": "",
+            "size": 1024,
+            "eTag": "test-etag",
+            "versionId": "test-version",
+            "sequencer": "test-seq",
+        },
+    },
+}
+
+
+def make_record(
+    key: str,
+    size: int = 1024,
+    e_tag: str = "test-etag",
+    version_id: str = "test-version",
+    sequencer: str = "test-seq",
+    event_time: str = "2023-01-01T12:00:00.000Z",
+    bucket: str = BUCKET_NAME,
+) -> Dict[str, Any]:
+    """Return an S3 event record for the given object."""
+    record = copy.deepcopy(BASE_RECORD)
+    record["eventTime"] = event_time
+    record["s3"]["bucket"].update(name=bucket, arn=f"arn:aws:s3:::{bucket}")
+    record["s3"]["object"].update(
+        key=key,
+        size=size,
+        eTag=e_tag,
+        versionId=version_id,
+        sequencer=sequencer,
+    )
+    return record
+
+
+def make_s3_event(*records: Dict[str, Any]) -> S3Event:
+    """Return an S3Event holding the given records."""
+    return S3Event({"Records": list(records)})
+
+
+@pytest.fixture(scope="session")
 def sample_s3_event_data() -> Dict[str, Any]:
     """Return sample S3 event data."""
     return {
         "Records": [
-            {
-                "eventVersion": "2.1",
-                "eventSource": "aws:s3",
-                "awsRegion": "us-east-1",
-                "eventTime": "2023-01-01T12:00:00.000Z",
-                "eventName": "ObjectCreated:Put",
-                "s3": {
-                    "s3SchemaVersion": "1.0",
-                    "configurationId": "test-config",
-                    "bucket": {
-                        "name": "test-documents-bucket",
-                        "ownerIdentity": {"principalId": "test-principal"},
-                        "arn": "arn:aws:s3:::test-documents-bucket",
-                    },
-                    "object": {
-                        "key": "documents/test_document.pdf",
-                        "size": 1024,
-                        "eTag": "test-etag",
-                        "versionId": "test-version-id",
-                        "sequencer": "test-sequencer",
-                    },
-                },
-            }
+            make_record(
+                SAMPLE_OBJECT_KEY,
+                version_id="test-version-id",
+                sequencer="test-sequencer",
+            )
         ]
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_s3_event(sample_s3_event_data: Dict[str, Any]) -> S3Event:
-    """Return a sample S3Event object."""
+    """Return a sample S3Event object, shared read-only between tests."""
     return S3Event(sample_s3_event_data)
 
 
@@ -94,7 +180,7 @@ def test_lambda_handler_success_single_pdf(
     mock_processor: MagicMock,
     mock_logger: MagicMock,
     sample_s3_event: S3Event,
-    sample_lambda_context: MagicMock,
+    sample_lambda_context: Mock,
 ):
     """Test successful processing of a single PDF file."""
     expected_result = {
@@ -109,86 +195,43 @@ def test_lambda_handler_success_single_pdf(
 
     assert result == {"results": [expected_result]}
     mock_processor.process_s3_object.assert_called_once_with(
-        "test-documents-bucket", "documents/test_document.pdf", mock_logger
-    )
-    mock_logger.info.assert_any_call("PDF ingestion Lambda triggered.")
-    mock_logger.info.assert_any_call(
-        "Processing S3 event record.",
-        extra={
-            "event_name": "ObjectCreated:Put",
-            "event_time": "2023-01-01T12:00:00.000Z",
-            "bucket_name": "test-documents-bucket",
-            "object_key": "documents/test_document.pdf",
-            "object_version_id": "test-version-id",
-            "object_size": 1024,
-        },
-    )
-    mock_logger.info.assert_any_call(
-        "Successfully processed and vectorized: s3://test-documents-bucket/documents/test_document.pdf"
-    )
-    mock_logger.info.assert_any_call(
-        "PDF ingestion processing loop completed for all records in the event."
+        BUCKET_NAME, SAMPLE_OBJECT_KEY, mock_logger
     )
+    # The handler logs these in order for a single record
+    assert mock_logger.info.call_args_list == [
+        call(TRIGGERED_MESSAGE),
+        call("Processing S3 event record.", extra=SAMPLE_RECORD_LOG_EXTRA),
+        call(
+            "Successfully processed and vectorized: "
+            f"s3://{BUCKET_NAME}/{SAMPLE_OBJECT_KEY}"
+        ),
+        call(LOOP_COMPLETED_MESSAGE),
+    ]
 
 
 def test_lambda_handler_multiple_pdf_files(
     handler_module: MagicMock,
     mock_processor: MagicMock,
     mock_logger: MagicMock,
-    sample_lambda_context: MagicMock,
+    sample_lambda_context: Mock,
 ):
     """Test processing multiple PDF files in a single event."""
-    event_data = {
-        "Records": [
-            {
-                "eventVersion": "2.1",
-                "eventSource": "aws:s3",
-                "awsRegion": "us-east-1",
-                "eventTime": "2023-01-01T12:00:00.000Z",
-                "eventName": "ObjectCreated:Put",
-                "s3": {
-                    "s3SchemaVersion": "1.0",
-                    "configurationId": "test-config",
-                    "bucket": {
-                        "name": "test-documents-bucket",
-                        "ownerIdentity": {"principalId": "test-principal"},
-                        "arn": "arn:aws:s3:::test-documents-bucket",
-                    },
-                    "object": {
-                        "key": "doc1.pdf",
-                        "size": 1024,
-                        "eTag": "etag1",
-                        "versionId": "version1",
-                        "sequencer": "seq1",
-                    },
-                },
-            },
-            {
-                "eventVersion": "2.1",
-                "eventSource": "aws:s3",
-                "awsRegion": "us-east-1",
-                "eventTime": "2023-01-01T12:05:00.000Z",
-                "eventName": "ObjectCreated:Put",
-                "s3": {
-                    "s3SchemaVersion": "1.0",
-                    "configurationId": "test-config",
-                    "bucket": {
-                        "name": "test-documents-bucket",
-                        "ownerIdentity": {"principalId": "test-principal"},
-                        "arn": "arn:aws:s3:::test-documents-bucket",
-                    },
-                    "object": {
-                        "key": "doc2.pdf",
-                        "size": 2048,
-                        "eTag": "etag2",
-                        "versionId": "version2",
-                        "sequencer": "seq2",
-                    },
-                },
-            },
-        ]
-    }
-    s3_event = S3Event(event_data)
+    s3_event = make_s3_event(
+        make_record(
+            "doc1.pdf",
+            e_tag="etag1",
+            version_id="version1",
+            sequencer="seq1",
+        ),
+        make_record(
+            "doc2.pdf",
+            size=2048,
+            e_tag="etag2",
+            version_id="version2",
+            sequencer="seq2",
+            event_time="2023-01-01T12:05:00.000Z",
+        ),
+    )
 
     expected_results = [
         {"status": "success", "message": "doc1 processed"},
@@ -199,125 +242,69 @@ def test_lambda_handler_multiple_pdf_files(
     result = handler_module.lambda_handler(s3_event, sample_lambda_context)
 
     assert result == {"results": expected_results}
-    assert mock_processor.process_s3_object.call_count == 2
-    mock_processor.process_s3_object.assert_any_call(
-        "test-documents-bucket", "doc1.pdf", mock_logger
-    )
-    mock_processor.process_s3_object.assert_any_call(
-        "test-documents-bucket", "doc2.pdf", mock_logger
-    )
+    assert mock_processor.process_s3_object.call_args_list == [
+        call(BUCKET_NAME, "doc1.pdf", mock_logger),
+        call(BUCKET_NAME, "doc2.pdf", mock_logger),
+    ]
 
 
-def test_lambda_handler_skip_non_pdf_files(
+@pytest.mark.parametrize(
+    "bucket,key",
+    [
+        pytest.param(BUCKET_NAME, "test_document.pdf", id="pdf"),
+        pytest.param(BUCKET_NAME, "test_document.PDF", id="PDF"),
+        pytest.param(BUCKET_NAME, "test_document.Pdf", id="Pdf"),
+        pytest.param(BUCKET_NAME, "test_document.pDf", id="pDf"),
+        pytest.param(
+            BUCKET_NAME,
+            "documents/file with spaces.pdf",
+            id="key-with-spaces",
+        ),
+        pytest.param("test-bucket", "test.pdf", id="other-bucket"),
+    ],
+)
+def test_lambda_handler_processes_pdf_objects(
     handler_module: MagicMock,
     mock_processor: MagicMock,
     mock_logger: MagicMock,
-    sample_lambda_context: MagicMock,
+    sample_lambda_context: Mock,
+    bucket: str,
+    key: str,
 ):
-    """Test that non-PDF files are skipped."""
-    event_data = {
-        "Records": [
-            {
-                "eventVersion": "2.1",
-                "eventSource": "aws:s3",
-                "awsRegion": "us-east-1",
-                "eventTime": "2023-01-01T12:00:00.000Z",
-                "eventName": "ObjectCreated:Put",
-                "s3": {
-                    "s3SchemaVersion": "1.0",
-                    "configurationId": "test-config",
-                    "bucket": {
-                        "name": "test-documents-bucket",
-                        "ownerIdentity": {"principalId": "test-principal"},
-                        "arn": "arn:aws:s3:::test-documents-bucket",
-                    },
-                    "object": {
-                        "key": "document.txt",
-                        "size": 512,
-                        "eTag": "test-etag",
-                        "versionId": "test-version",
-                        "sequencer": "test-seq",
-                    },
-                },
-            }
-        ]
-    }
-    s3_event = S3Event(event_data)
+    """Test that PDF objects are passed on to the processor."""
+    s3_event = make_s3_event(make_record(key, bucket=bucket))
 
     result = handler_module.lambda_handler(s3_event, sample_lambda_context)
 
-    assert result == {"results": []}
-    mock_processor.process_s3_object.assert_not_called()
-    mock_logger.warning.assert_called_once_with(
-        "Object document.txt is not a PDF file. Skipping."
+    # The bucket and decoded key are read from the S3Event record
+    mock_processor.process_s3_object.assert_called_once_with(
+        bucket, key, mock_logger
     )
+    assert len(result["results"]) == 1
 
 
-@pytest.mark.parametrize(
-    "file_extension,should_process",
-    [
-        (".pdf", True),
-        (".PDF", True),
-        (".Pdf", True),
-        (".pDf", True),
-        (".txt", False),
-        (".docx", False),
-        (".png", False),
-        ("", False),
-    ],
-)
-def test_lambda_handler_file_extension_handling(
+def test_lambda_handler_skips_non_pdf_objects(
     handler_module: MagicMock,
     mock_processor: MagicMock,
     mock_logger: MagicMock,
-    sample_lambda_context: MagicMock,
-    file_extension: str,
-    should_process: bool,
+    sample_lambda_context: Mock,
 ):
-    """Test file extension handling for various cases."""
-    filename = f"test_document{file_extension}"
-    event_data = {
-        "Records": [
-            {
-                "eventVersion": "2.1",
-                "eventSource": "aws:s3",
-                "awsRegion": "us-east-1",
-                "eventTime": "2023-01-01T12:00:00.000Z",
-                "eventName": "ObjectCreated:Put",
-                "s3": {
-                    "s3SchemaVersion": "1.0",
-                    "configurationId": "test-config",
-                    "bucket": {
-                        "name": "test-documents-bucket",
-                        "ownerIdentity": {"principalId": "test-principal"},
-                        "arn": "arn:aws:s3:::test-documents-bucket",
-                    },
-                    "object": {
-                        "key": filename,
-                        "size": 1024,
-                        "eTag": "test-etag",
-                        "versionId": "test-version",
-                        "sequencer": "test-seq",
-                    },
-                },
-            }
-        ]
-    }
-    s3_event = S3Event(event_data)
+    """Test that objects without a .pdf extension are skipped."""
+    keys = [
+        "test_document.txt",
+        "test_document.docx",
+        "test_document.png",
+        "test_document",
+    ]
+    s3_event = make_s3_event(*(make_record(key) for key in keys))
 
     result = handler_module.lambda_handler(s3_event, sample_lambda_context)
 
-    if should_process:
-        mock_processor.process_s3_object.assert_called_once_with(
-            "test-documents-bucket", filename, mock_logger
-        )
-        assert len(result["results"]) == 1
-    else:
-        mock_processor.process_s3_object.assert_not_called()
-        mock_logger.warning.assert_called_once_with(
-            f"Object {filename} is not a PDF file. Skipping."
-        )
-        assert result == {"results": []}
+    assert result == {"results": []}
+    mock_processor.process_s3_object.assert_not_called()
+    assert mock_logger.warning.call_args_list == [
+        call(f"Object {key} is not a PDF file. Skipping.") for key in keys
+    ]
 
 
 def test_lambda_handler_processor_exception(
@@ -325,7 +312,7 @@ def test_lambda_handler_processor_exception(
     mock_processor: MagicMock,
     mock_logger: MagicMock,
     sample_s3_event: S3Event,
-    sample_lambda_context: MagicMock,
+    sample_lambda_context: Mock,
 ):
     """Test handling of processor exceptions."""
     error_message = "Failed to process PDF document"
@@ -337,12 +324,13 @@ def test_lambda_handler_processor_exception(
 
     expected_error_result = {
         "error": error_message,
-        "bucket": "test-documents-bucket",
-        "key": "documents/test_document.pdf",
+        "bucket": BUCKET_NAME,
+        "key": SAMPLE_OBJECT_KEY,
     }
     assert result == {"results": [expected_error_result]}
     mock_logger.exception.assert_called_once_with(
-        "Failed to process s3://test-documents-bucket/documents/test_document.pdf. Error: Failed to process PDF document"
+        f"Failed to process s3://{BUCKET_NAME}/{SAMPLE_OBJECT_KEY}. "
+        f"Error: {error_message}"
     )
 
 
@@ -350,60 +338,25 @@ def test_lambda_handler_mixed_success_and_failure(
     handler_module: MagicMock,
     mock_processor: MagicMock,
     mock_logger: MagicMock,
-    sample_lambda_context: MagicMock,
+    sample_lambda_context: Mock,
 ):
     """Test handling of mixed success and failure scenarios."""
-    event_data = {
-        "Records": [
-            {
-                "eventVersion": "2.1",
-                "eventSource": "aws:s3",
-                "awsRegion": "us-east-1",
-                "eventTime": "2023-01-01T12:00:00.000Z",
-                "eventName": "ObjectCreated:Put",
-                "s3": {
-                    "s3SchemaVersion": "1.0",
-                    "configurationId": "test-config",
-                    "bucket": {
-                        "name": "test-documents-bucket",
-                        "ownerIdentity": {"principalId": "test-principal"},
-                        "arn": "arn:aws:s3:::test-documents-bucket",
-                    },
-                    "object": {
-                        "key": "success.pdf",
-                        "size": 1024,
-                        "eTag": "etag1",
-                        "versionId": "version1",
-                        "sequencer": "seq1",
-                    },
-                },
-            },
-            {
-                "eventVersion": "2.1",
-                "eventSource": "aws:s3",
-                "awsRegion": "us-east-1",
-                "eventTime": "2023-01-01T12:05:00.000Z",
-                "eventName": "ObjectCreated:Put",
-                "s3": {
-                    "s3SchemaVersion": "1.0",
-                    "configurationId": "test-config",
-                    "bucket": {
-                        "name": "test-documents-bucket",
-                        "ownerIdentity": {"principalId": "test-principal"},
-                        "arn": "arn:aws:s3:::test-documents-bucket",
-                    },
-                    "object": {
-                        "key": "failure.pdf",
-                        "size": 2048,
-                        "eTag": "etag2",
-                        "versionId": "version2",
-                        "sequencer": "seq2",
-                    },
-                },
-            },
-        ]
-    }
-    s3_event = S3Event(event_data)
+    s3_event = make_s3_event(
+        make_record(
+            "success.pdf",
+            e_tag="etag1",
+            version_id="version1",
+            sequencer="seq1",
+        ),
+        make_record(
+            "failure.pdf",
+            size=2048,
+            e_tag="etag2",
+            version_id="version2",
+            sequencer="seq2",
+            event_time="2023-01-01T12:05:00.000Z",
+        ),
+    )
 
     success_result = {"status": "success", "message": "Processed successfully"}
     error_message = "Processing failed"
@@ -422,83 +375,41 @@ def test_lambda_handler_mixed_success_and_failure(
         success_result,
         {
             "error": error_message,
-            "bucket": "test-documents-bucket",
+            "bucket": BUCKET_NAME,
             "key": "failure.pdf",
         },
     ]
     assert result == {"results": expected_results}
-    assert mock_processor.process_s3_object.call_count == 2
+    assert mock_processor.process_s3_object.call_args_list == [
+        call(BUCKET_NAME, "success.pdf", mock_logger),
+        call(BUCKET_NAME, "failure.pdf", mock_logger),
+    ]
 
 
 def test_lambda_handler_empty_event(
     handler_module: MagicMock,
     mock_processor: MagicMock,
     mock_logger: MagicMock,
-    sample_lambda_context: MagicMock,
+    sample_lambda_context: Mock,
 ):
     """Test handling of empty S3 event."""
-    event_data = {"Records": []}
-    s3_event = S3Event(event_data)
+    s3_event = make_s3_event()
 
     result = handler_module.lambda_handler(s3_event, sample_lambda_context)
 
     assert result == {"results": []}
     mock_processor.process_s3_object.assert_not_called()
-    mock_logger.info.assert_any_call("PDF ingestion Lambda triggered.")
-    mock_logger.info.assert_any_call(
-        "PDF ingestion processing loop completed for all records in the event."
-    )
-
-
-def test_lambda_handler_url_encoded_object_key(
-    handler_module: MagicMock,
-    mock_processor: MagicMock,
-    mock_logger: MagicMock,
-    sample_lambda_context: MagicMock,
-):
-    """Test handling of URL-encoded object keys."""
-    # S3Event automatically decodes URL-encoded keys
-    event_data = {
-        "Records": [
-            {
-                "eventVersion": "2.1",
-                "eventSource": "aws:s3",
-                "awsRegion": "us-east-1",
-                "eventTime": "2023-01-01T12:00:00.000Z",
-                "eventName": "ObjectCreated:Put",
-                "s3": {
-                    "s3SchemaVersion": "1.0",
-                    "configurationId": "test-config",
-                    "bucket": {
-                        "name": "test-documents-bucket",
-                        "ownerIdentity": {"principalId": "test-principal"},
-                        "arn": "arn:aws:s3:::test-documents-bucket",
-                    },
-                    "object": {
-                        "key": "documents/file with spaces.pdf",
-                        "size": 1024,
-                        "eTag": "test-etag",
-                        "versionId": "test-version",
-                        "sequencer": "test-seq",
-                    },
-                },
-            }
-        ]
-    }
-    s3_event = S3Event(event_data)
-
-    handler_module.lambda_handler(s3_event, sample_lambda_context)
-
-    mock_processor.process_s3_object.assert_called_once_with(
-        "test-documents-bucket", "documents/file with spaces.pdf", mock_logger
-    )
+    assert mock_logger.info.call_args_list == [
+        call(TRIGGERED_MESSAGE),
+        call(LOOP_COMPLETED_MESSAGE),
+    ]
 
 
 def test_lambda_handler_logging_context_injection(
     handler_module: MagicMock,
     mock_processor: MagicMock,
     sample_s3_event: S3Event,
-    sample_lambda_context: MagicMock,
+    sample_lambda_context: Mock,
 ):
     """Test that the lambda_handler has proper logging context injection."""
     # This test verifies the decorators are applied correctly
@@ -514,46 +425,3 @@ def test_lambda_handler_logging_context_injection(
 
     assert "results" in result
     assert isinstance(result["results"], list)
-
-
-def test_s3_event_data_class_usage(
-    handler_module: MagicMock,
-    mock_processor: MagicMock,
-    sample_lambda_context: MagicMock,
-):
-    """Test that the handler properly uses S3Event data class features."""
-    event_data = {
-        "Records": [
-            {
-                "eventVersion": "2.1",
-                "eventSource": "aws:s3",
-                "awsRegion": "us-east-1",
-                "eventTime": "2023-01-01T12:00:00.000Z",
-                "eventName": "ObjectCreated:Put",
-                "s3": {
-                    "s3SchemaVersion": "1.0",
-                    "configurationId": "test-config",
-                    "bucket": {
-                        "name": "test-bucket",
-                        "ownerIdentity": {"principalId": "test-principal"},
-                        "arn": "arn:aws:s3:::test-bucket",
-                    },
-                    "object": {
-                        "key": "test.pdf",
-                        "size": 1024,
-                        "eTag": "test-etag",
-                        "versionId": "test-version",
-                        "sequencer": "test-seq",
-                    },
-                },
-            }
-        ]
-    }
-    s3_event = S3Event(event_data)
-
-    handler_module.lambda_handler(s3_event, sample_lambda_context)
-
-    # Verify that the handler accesses S3Event properties correctly
-    mock_processor.process_s3_object.assert_called_once_with(
-        "test-bucket", "test.pdf", handler_module.logger
-    )
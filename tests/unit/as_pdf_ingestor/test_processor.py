@@ -0,0 +1,77 @@
+"""Unit tests for the PDF ingestor processor module."""
+
+# Third Party
+import faiss
+import numpy as np
+import pytest
+
+# Local Modules
+from pdf_ingestor import processor
+
+DIMENSION = 8
+NUM_VECTORS = 10
+
+
+@pytest.fixture(scope="module")
+def vectors() -> np.ndarray:
+    """Return a small, fixed set of float32 vectors."""
+    rng = np.random.default_rng(0)
+    return rng.random((NUM_VECTORS, DIMENSION), dtype="float32")
+
+
+def _flat_index(index_class: type, vectors: np.ndarray) -> faiss.Index:
+    """Build a flat FP32 index of the given class holding ``vectors``."""
+    index = index_class(DIMENSION)
+    index.add(vectors)
+    return index
+
+
+class TestQuantizeIndex:
+    def test_default_factory_is_sq8(self, vectors):
+        result = processor.quantize_index(
+            _flat_index(faiss.IndexFlatL2, vectors)
+        )
+
+        result = faiss.downcast_index(result)
+        assert isinstance(result, faiss.IndexScalarQuantizer)
+        assert result.sq.qtype == faiss.ScalarQuantizer.QT_8bit
+        assert result.ntotal == NUM_VECTORS
+        assert result.metric_type == faiss.METRIC_L2
+
+    def test_inner_product_metric_is_preserved(self, vectors):
+        result = processor.quantize_index(
+            _flat_index(faiss.IndexFlatIP, vectors)
+        )
+
+        assert result.metric_type == faiss.METRIC_INNER_PRODUCT
+        assert result.ntotal == NUM_VECTORS
+
+    def test_factory_string_override(self, vectors):
+        result = processor.quantize_index(
+            _flat_index(faiss.IndexFlatL2, vectors), "SQ4"
+        )
+
+        result = faiss.downcast_index(result)
+        assert result.sq.qtype == faiss.ScalarQuantizer.QT_4bit
+        assert result.ntotal == NUM_VECTORS
+
+    def test_untrainable_factory_falls_back_to_sq8(self, vectors):
+        # IVF needs at least as many training vectors as lists
+        result = processor.quantize_index(
+            _flat_index(faiss.IndexFlatIP, vectors), "IVF64,Flat"
+        )
+
+        result = faiss.downcast_index(result)
+        assert isinstance(result, faiss.IndexScalarQuantizer)
+        assert result.sq.qtype == faiss.ScalarQuantizer.QT_8bit
+        assert result.ntotal == NUM_VECTORS
+        assert result.metric_type == faiss.METRIC_INNER_PRODUCT
+
+    def test_vectors_keep_their_order(self, vectors):
+        result = processor.quantize_index(
+            _flat_index(faiss.IndexFlatL2, vectors)
+        )
+
+        np.testing.assert_allclose(
+            result.reconstruct_n(0, NUM_VECTORS), vectors, atol=0.01
+        )
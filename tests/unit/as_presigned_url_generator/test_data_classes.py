@@ -7,6 +7,12 @@ import pytest
 # Local
 from presigned_url_generator.data_classes import PresignedUrlRequest
 
+EXPECTED_FIELD_METADATA = {
+    "file_name": {"description": "The name of the file to upload."},
+    "srd_id": {"description": "The ID of the SRD document."},
+    "content_type": {"description": "Optional content type for the file."},
+}
+
 
 def test_presigned_url_request_creation_valid():
     """Test creating a PresignedUrlRequest with valid data."""
@@ -37,15 +43,10 @@ def test_presigned_url_request_creation_default_content_type():
 
 def test_presigned_url_request_field_metadata():
     """Test the metadata of PresignedUrlRequest fields."""
-    expected_metadata = {
-        "file_name": {"description": "The name of the file to upload."},
-        "srd_id": {"description": "The ID of the SRD document."},
-        "content_type": {"description": "Optional content type for the file."},
-    }
-
-    for field_info in fields(PresignedUrlRequest):
-        assert field_info.name in expected_metadata
-        assert field_info.metadata == expected_metadata[field_info.name]
+    assert {
+        field_info.name: dict(field_info.metadata)
+        for field_info in fields(PresignedUrlRequest)
+    } == EXPECTED_FIELD_METADATA
 
 
 @pytest.mark.parametrize(
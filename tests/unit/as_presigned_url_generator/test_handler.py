@@ -1,5 +1,6 @@
 # Standard Library
 import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 # Third-Party
@@ -10,45 +11,85 @@ from botocore.exceptions import ClientError
 from tests.conftest import import_handler
 
 
+def error_message(result):
+    """Return the error message from a handler response body."""
+    return json.loads(result["body"])["error"]
+
+
+@pytest.fixture(scope="module")
+def handler():
+    """Import the handler module."""
+    return import_handler("as-presigned-url-generator")
+
+
+@pytest.fixture(scope="class")
+def installed_mocks(handler):
+    """Patch the handler's collaborators once per test class."""
+    with (
+        patch.object(handler, "app") as mock_app,
+        patch.object(handler, "processor") as mock_proc,
+        patch.object(handler, "logger") as mock_logger,
+    ):
+        yield {
+            "app": mock_app,
+            "processor": mock_proc,
+            "logger": mock_logger,
+        }
+
+
+@pytest.fixture(scope="module")
+def sample_context():
+    """Sample Lambda context for testing."""
+    return SimpleNamespace(
+        function_name="test_function",
+        memory_limit_in_mb=128,
+        aws_request_id="test-request-id",
+        invoked_function_arn="arn:aws:lambda:us-east-1:123456789012:function:test_function",
+    )
+
+
 class TestHandler:
     """Tests for the handler.py module."""
 
-    @pytest.fixture
-    def handler(self):
-        """Import the handler module."""
-        return import_handler("as-presigned-url-generator")
+    @pytest.fixture(autouse=True)
+    def reset_installed_mocks(self, installed_mocks):
+        """Restore the shared mocks to their defaults before each test."""
+        for mock in installed_mocks.values():
+            mock.reset_mock(return_value=True, side_effect=True)
+
+        mock_app = installed_mocks["app"]
+        mock_app.current_event = SimpleNamespace(
+            json_body={"file_name": "test.pdf", "srd_id": "dnd5e"},
+            body='{"file_name": "test.pdf", "srd_id": "dnd5e"}',
+        )
+        mock_app.resolve.return_value = {"statusCode": 200}
+
+        mock_proc = installed_mocks["processor"]
+        mock_proc.s3_client = MagicMock()
+        mock_proc.DOCUMENTS_BUCKET_NAME = "test-bucket"
+        mock_proc.generate_presigned_url.return_value = (
+            "https://example.com/presigned-url"
+        )
 
     @pytest.fixture
-    def mock_app(self, handler):
+    def mock_app(self, installed_mocks):
         """Mock the API Gateway resolver."""
-        with patch.object(handler, "app") as mock_app:
-            mock_event = MagicMock()
-            mock_event.json_body = {"file_name": "test.pdf", "srd_id": "dnd5e"}
-            mock_event.body = '{"file_name": "test.pdf", "srd_id": "dnd5e"}'
-            mock_app.current_event = mock_event
-            mock_app.resolve.return_value = {"statusCode": 200}
-            yield mock_app
+        return installed_mocks["app"]
 
     @pytest.fixture
-    def mock_processor(self, handler):
+    def mock_processor(self, installed_mocks):
         """Mock the processor module."""
-        with patch.object(handler, "processor") as mock_proc:
-            mock_proc.s3_client = MagicMock()
-            mock_proc.DOCUMENTS_BUCKET_NAME = "test-bucket"
-            mock_proc.generate_presigned_url.return_value = (
-                "https://example.com/presigned-url"
-            )
-            yield mock_proc
+        return installed_mocks["processor"]
 
     @pytest.fixture
-    def mock_logger(self, handler):
+    def mock_logger(self, installed_mocks):
         """Mock the logger."""
-        with patch.object(handler, "logger") as mock_logger:
-            yield mock_logger
+        return installed_mocks["logger"]
 
     @pytest.fixture
     def mock_presigned_url_request(self, handler):
         """Mock the PresignedUrlRequest dataclass."""
+        # Patched per test, since other tests parse with the real dataclass
         with patch.object(handler, "PresignedUrlRequest") as mock_request:
             mock_instance = MagicMock()
             mock_instance.file_name = "test.pdf"
@@ -57,16 +98,6 @@ class TestHandler:
             mock_request.return_value = mock_instance
             yield mock_request
 
-    @pytest.fixture
-    def sample_context(self):
-        """Sample Lambda context for testing."""
-        return MagicMock(
-            function_name="test_function",
-            memory_limit_in_mb=128,
-            aws_request_id="test-request-id",
-            invoked_function_arn="arn:aws:lambda:us-east-1:123456789012:function:test_function",
-        )
-
     def test_lambda_handler_success(self, handler, mock_app, sample_context):
         """Test successful lambda_handler execution."""
         event = {"path": "/srd/upload-url", "httpMethod": "POST"}
@@ -84,10 +115,7 @@ class TestHandler:
         result = handler.lambda_handler(event, sample_context)
 
         assert result["statusCode"] == 500
-        assert (
-            json.loads(result["body"])["error"]
-            == "An internal server error occurred."
-        )
+        assert error_message(result) == "An internal server error occurred."
 
     def test_get_presigned_url_success(
         self,
@@ -141,57 +169,6 @@ class TestHandler:
             expiration=900,
         )
 
-    def test_get_presigned_url_no_s3_client(
-        self, handler, mock_app, mock_processor
-    ):
-        """Test error handling when S3 client is not initialized."""
-        mock_processor.s3_client = None
-
-        result = handler.get_presigned_url()
-
-        assert result["statusCode"] == 500
-        error_message = json.loads(result["body"])["error"]
-        assert "S3 client not available" in error_message
-
-    def test_get_presigned_url_no_bucket_name(
-        self, handler, mock_app, mock_processor
-    ):
-        """Test error handling when bucket name is not configured."""
-        mock_processor.DOCUMENTS_BUCKET_NAME = None
-
-        result = handler.get_presigned_url()
-
-        assert result["statusCode"] == 500
-        error_message = json.loads(result["body"])["error"]
-        assert "Bucket not configured" in error_message
-
-    def test_get_presigned_url_invalid_request_body(self, handler, mock_app):
-        """Test error handling with non-dict request body."""
-        mock_app.current_event.json_body = "not-a-dict"
-
-        result = handler.get_presigned_url()
-
-        assert result["statusCode"] == 400
-        error_message = json.loads(result["body"])["error"]
-        assert "Request body must be a JSON object" in error_message
-
-    def test_get_presigned_url_missing_required_field(
-        self, handler, mock_app, mock_processor
-    ):
-        """Test error handling with missing file_name field."""
-        mock_app.current_event.json_body = {}
-
-        with patch.object(handler, "PresignedUrlRequest") as mock_request:
-            mock_request.side_effect = TypeError(
-                "__init__() missing 1 required positional argument: 'file_name'"
-            )
-
-            result = handler.get_presigned_url()
-
-            assert result["statusCode"] == 400
-            error_message = json.loads(result["body"])["error"]
-            assert "'file_name' is a required field" in error_message
-
     def test_get_presigned_url_empty_file_name(
         self,
         handler,
@@ -205,8 +182,7 @@ class TestHandler:
         result = handler.get_presigned_url()
 
         assert result["statusCode"] == 400
-        error_message = json.loads(result["body"])["error"]
-        assert "non-empty string" in error_message
+        assert "non-empty string" in error_message(result)
 
     def test_get_presigned_url_invalid_content_type(
         self,
@@ -224,71 +200,113 @@ class TestHandler:
         result = handler.get_presigned_url()
 
         assert result["statusCode"] == 400
-        error_message = json.loads(result["body"])["error"]
-        assert "must be a string" in error_message
-
-    def test_get_presigned_url_value_error(
-        self, handler, mock_app, mock_processor
-    ):
-        """Test error handling with ValueError during request parsing."""
-        with patch.object(handler, "PresignedUrlRequest") as mock_request:
-            mock_request.side_effect = ValueError("Invalid value")
-
-            result = handler.get_presigned_url()
-
-            assert result["statusCode"] == 400
-            assert "Invalid value" in json.loads(result["body"])["error"]
-
-    def test_get_presigned_url_general_exception_during_parsing(
-        self, handler, mock_app, mock_processor
-    ):
-        """Test error handling with general exception during request parsing."""
-        with patch.object(handler, "PresignedUrlRequest") as mock_request:
-            mock_request.side_effect = Exception("Unexpected error")
-
-            result = handler.get_presigned_url()
-
-            assert result["statusCode"] == 400
-            assert (
-                "Error processing request data"
-                in json.loads(result["body"])["error"]
-            )
-
-    def test_get_presigned_url_client_error(
+        assert "must be a string" in error_message(result)
+
+    @pytest.mark.parametrize(
+        "mutate, expected_status, expected_error",
+        [
+            pytest.param(
+                lambda app, proc: setattr(proc, "s3_client", None),
+                500,
+                "S3 client not available",
+                id="no_s3_client",
+            ),
+            pytest.param(
+                lambda app, proc: setattr(proc, "DOCUMENTS_BUCKET_NAME", None),
+                500,
+                "Bucket not configured",
+                id="no_bucket_name",
+            ),
+            pytest.param(
+                lambda app, proc: setattr(
+                    app.current_event, "json_body", "not-a-dict"
+                ),
+                400,
+                "Request body must be a JSON object",
+                id="invalid_request_body",
+            ),
+            pytest.param(
+                lambda app, proc: setattr(
+                    proc.generate_presigned_url,
+                    "side_effect",
+                    ClientError(
+                        {
+                            "Error": {
+                                "Code": "TestException",
+                                "Message": "Test error",
+                            }
+                        },
+                        "generate_presigned_url",
+                    ),
+                ),
+                500,
+                "Could not generate upload URL",
+                id="client_error",
+            ),
+            pytest.param(
+                lambda app, proc: setattr(
+                    proc.generate_presigned_url,
+                    "side_effect",
+                    Exception("Unexpected error"),
+                ),
+                500,
+                "An unexpected error occurred",
+                id="unexpected_error",
+            ),
+        ],
+    )
+    def test_get_presigned_url_error_responses(
         self,
         handler,
         mock_app,
         mock_processor,
+        mutate,
+        expected_status,
+        expected_error,
     ):
-        """Test error handling with boto3 ClientError."""
-        mock_processor.generate_presigned_url.side_effect = ClientError(
-            {"Error": {"Code": "TestException", "Message": "Test error"}},
-            "generate_presigned_url",
-        )
+        """Test the error response for each failing dependency."""
+        mutate(mock_app, mock_processor)
 
         result = handler.get_presigned_url()
 
-        assert result["statusCode"] == 500
-        assert (
-            "Could not generate upload URL"
-            in json.loads(result["body"])["error"]
-        )
-
-    def test_get_presigned_url_unexpected_error(
+        assert result["statusCode"] == expected_status
+        assert expected_error in error_message(result)
+
+    @pytest.mark.parametrize(
+        "parse_error, expected_error",
+        [
+            pytest.param(
+                TypeError(
+                    "__init__() missing 1 required positional argument: "
+                    "'file_name'"
+                ),
+                "'file_name' is a required field",
+                id="missing_required_field",
+            ),
+            pytest.param(
+                ValueError("Invalid value"),
+                "Invalid value",
+                id="value_error",
+            ),
+            pytest.param(
+                Exception("Unexpected error"),
+                "Error processing request data",
+                id="general_exception",
+            ),
+        ],
+    )
+    def test_get_presigned_url_request_parsing_errors(
         self,
         handler,
         mock_app,
-        mock_processor,
+        mock_presigned_url_request,
+        parse_error,
+        expected_error,
     ):
-        """Test error handling with unexpected exception during URL generation."""
-        mock_processor.generate_presigned_url.side_effect = Exception(
-            "Unexpected error"
-        )
+        """Test the 400 response when the request body cannot be parsed."""
+        mock_presigned_url_request.side_effect = parse_error
 
         result = handler.get_presigned_url()
 
-        assert result["statusCode"] == 500
-        assert (
-            "An unexpected error occurred"
-            in json.loads(result["body"])["error"]
-        )
+        assert result["statusCode"] == 400
+        assert expected_error in error_message(result)
@@ -1,7 +1,10 @@
 # Standard Library
+import ast
 import json
-from typing import Generator, Any, Dict
-from unittest.mock import MagicMock, patch
+from dataclasses import dataclass
+from typing import Any, Dict
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
 # Third Party
 import pytest
@@ -10,73 +13,113 @@ import pytest
 # Assuming conftest.py provides import_handler similar to the guideline
 from tests.conftest import import_handler
 
+# Default valid request body and its serialized form
+DEFAULT_BODY: Dict[str, Any] = {
+    "query_text": "What is the meaning of life?",
+    "srd_id": "general_knowledge_srd",
+    "invoke_generative_llm": False,
+}
+DEFAULT_BODY_JSON = json.dumps(DEFAULT_BODY)
 
-@pytest.fixture
+# Serialized body of the default resolver response
+RESOLVED_BODY_JSON = json.dumps({"message": "Resolved"})
+
+
+@pytest.fixture(scope="session")
 def handler_module():
     """Import and return the as-rag-query handler module."""
     return import_handler("as-rag-query")
 
 
 @pytest.fixture
-def mock_app(handler_module: MagicMock) -> Generator[MagicMock, None, None]:
+def mock_app(
+    handler_module: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> Mock:
     """Mock the APIGatewayHttpResolver instance (app) in the handler."""
-    with patch.object(handler_module, "app") as mock_app_instance:
-        mock_event = MagicMock()
-        # Default valid body for most tests
-        mock_event.json_body = {
-            "query_text": "What is the meaning of life?",
-            "srd_id": "general_knowledge_srd",
-            "invoke_generative_llm": False,
-        }
-        mock_event.body = json.dumps(mock_event.json_body)
-        mock_app_instance.current_event = mock_event
-        # Default resolve for lambda_handler tests
-        mock_app_instance.resolve.return_value = {
-            "statusCode": 200,
-            "body": json.dumps({"message": "Resolved"}),
-        }
-        yield mock_app_instance
+    # Only the attributes the handler reads, so typos fail loudly
+    mock_app_instance = Mock(spec_set=["current_event", "resolve"])
+    mock_event = Mock(spec_set=["json_body", "body"])
+    # Default valid body for most tests
+    mock_event.json_body = dict(DEFAULT_BODY)
+    mock_event.body = DEFAULT_BODY_JSON
+    mock_app_instance.current_event = mock_event
+    # Default resolve for lambda_handler tests
+    mock_app_instance.resolve.return_value = {
+        "statusCode": 200,
+        "body": RESOLVED_BODY_JSON,
+    }
+    monkeypatch.setattr(handler_module, "app", mock_app_instance)
+    return mock_app_instance
 
 
 @pytest.fixture
 def mock_processor(
-    handler_module: MagicMock,
-    mocked_s3,
-    mocked_dynamodb,
-    mocked_bedrock_runtime,
-) -> Generator[MagicMock, None, None]:
+    handler_module: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> SimpleNamespace:
     """Mock the processor module used by the handler."""
-    with patch.object(handler_module, "processor") as mock_processor_instance:
-        # Mock attributes checked by the handler
-        mock_processor_instance.s3_client = mocked_s3
-        mock_processor_instance.embedding_model = mocked_dynamodb
-        mock_processor_instance.bedrock_runtime_client = mocked_bedrock_runtime
-        mock_processor_instance.DEFAULT_SRD_ID = "default_srd_id_value"
-        # Mock the main function call
-        mock_processor_instance.get_answer_from_rag.return_value = {
-            "answer": "This is a mock answer from RAG."
-        }
-        yield mock_processor_instance
+    mock_processor_instance = SimpleNamespace(
+        # The handler only checks these clients for truthiness
+        s3_client=object(),
+        embedding_model=object(),
+        bedrock_runtime_client=object(),
+        DEFAULT_SRD_ID="default_srd_id_value",
+        get_answer_from_rag=Mock(
+            spec=[],
+            return_value={"answer": "This is a mock answer from RAG."},
+        ),
+    )
+    monkeypatch.setattr(handler_module, "processor", mock_processor_instance)
+    return mock_processor_instance
 
 
 @pytest.fixture
-def mock_logger(handler_module: MagicMock) -> Generator[MagicMock, None, None]:
+def mock_logger(
+    handler_module: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> MagicMock:
     """Mock the logger instance in the handler."""
-    with patch.object(handler_module, "logger") as mock_log:
-        yield mock_log
+    mock_log = MagicMock()
+    monkeypatch.setattr(handler_module, "logger", mock_log)
+    return mock_log
 
 
-@pytest.fixture
-def sample_lambda_context() -> MagicMock:
-    """Return a sample Lambda context object."""
-    context = MagicMock()
-    context.function_name = "test_rag_query_lambda"
-    context.memory_limit_in_mb = 256
-    context.aws_request_id = "test-rag-query-request-id"
-    context.invoked_function_arn = (
+@dataclass(frozen=True)
+class MockLambdaContext:
+    """Lambda context holding the attributes the handler and logger read."""
+
+    function_name: str = "test_rag_query_lambda"
+    memory_limit_in_mb: int = 256
+    aws_request_id: str = "test-rag-query-request-id"
+    invoked_function_arn: str = (
         "arn:aws:lambda:us-east-1:123456789012:function:test_rag_query_lambda"
     )
-    return context
+
+    def get_remaining_time_in_millis(self) -> int:
+        """Return a fixed amount of remaining execution time."""
+        return 3000
+
+
+@pytest.fixture(scope="session")
+def sample_lambda_context() -> MockLambdaContext:
+    """Return a sample Lambda context object."""
+    return MockLambdaContext()
+
+
+def assert_rag_called_once(
+    mock_processor: SimpleNamespace,
+    query_text: str,
+    srd_id: str,
+    invoke_generative_llm: bool,
+    lambda_logger: MagicMock,
+) -> None:
+    """Assert the handler queried the processor once with default options."""
+    mock_processor.get_answer_from_rag.assert_called_once_with(
+        query_text=query_text,
+        srd_id=srd_id,
+        invoke_generative_llm=invoke_generative_llm,
+        use_conversational_style=False,
+        generation_config_payload={},
+        lambda_logger=lambda_logger,
+    )
 
 
 class TestRagQueryHandler:
@@ -87,14 +130,14 @@ class TestRagQueryHandler:
     def test_lambda_handler_success(
         self,
         handler_module: MagicMock,
-        mock_app: MagicMock,
-        sample_lambda_context: MagicMock,
+        mock_app: Mock,
+        sample_lambda_context: MockLambdaContext,
     ):
         """Test successful execution of lambda_handler."""
         event = {"httpMethod": "POST", "path": "/query"}
         expected_response = {
             "statusCode": 200,
-            "body": json.dumps({"message": "Resolved"}),
+            "body": RESOLVED_BODY_JSON,
         }
         mock_app.resolve.return_value = expected_response
 
@@ -106,9 +149,9 @@ class TestRagQueryHandler:
     def test_lambda_handler_resolve_exception(
         self,
         handler_module: MagicMock,
-        mock_app: MagicMock,
+        mock_app: Mock,
         mock_logger: MagicMock,
-        sample_lambda_context: MagicMock,
+        sample_lambda_context: MockLambdaContext,
     ):
         """Test lambda_handler when app.resolve raises an exception."""
         event = {"httpMethod": "POST", "path": "/query"}
@@ -126,8 +169,8 @@ class TestRagQueryHandler:
     def test_query_endpoint_success_basic(
         self,
         handler_module: MagicMock,
-        mock_app: MagicMock,
-        mock_processor: MagicMock,
+        mock_app: Mock,
+        mock_processor: SimpleNamespace,
         mock_logger: MagicMock,
     ):
         """Test successful query_endpoint execution with valid inputs."""
@@ -144,20 +187,15 @@ class TestRagQueryHandler:
 
         assert result["statusCode"] == 200
         assert json.loads(result["body"]) == {"answer": "Success!"}
-        mock_processor.get_answer_from_rag.assert_called_once_with(
-            query_text="Test query?",
-            srd_id="test_srd_123",
-            invoke_generative_llm=True,
-            use_conversational_style=False,
-            generation_config_payload={},
-            lambda_logger=mock_logger,
+        assert_rag_called_once(
+            mock_processor, "Test query?", "test_srd_123", True, mock_logger
         )
 
     def test_query_endpoint_processor_not_initialized(
         self,
         handler_module: MagicMock,
-        mock_app: MagicMock,
-        mock_processor: MagicMock,
+        mock_app: Mock,
+        mock_processor: SimpleNamespace,
         mock_logger: MagicMock,
     ):
         """Test query_endpoint when a processor component is not initialized."""
@@ -220,7 +258,7 @@ class TestRagQueryHandler:
     def test_query_endpoint_invalid_input(
         self,
         handler_module: MagicMock,
-        mock_app: MagicMock,
+        mock_app: Mock,
         mock_logger: MagicMock,
         body_input: Any,
         expected_error_message: str,
@@ -228,16 +266,11 @@ class TestRagQueryHandler:
     ):
         """Test query_endpoint with various invalid input scenarios."""
         if isinstance(body_input, str) and body_input == "not_a_dict":
-            # Simulate APIGatewayHttpResolver behavior for non-dict json_body
-            # For this specific case, we make json_body itself non-dict
-            mock_app.current_event.json_body = "not_a_dict_payload"
-            # And simulate the ValueError that would be raised by isinstance check
-            # by making the .get call fail if it were not a dict.
-            # A more direct way is to set it and let the isinstance check fail.
+            # A non-dict json_body fails the handler's isinstance check
             mock_app.current_event.json_body = "this_is_a_string_not_a_dict"
-
         else:
             mock_app.current_event.json_body = body_input
+        # The handler logs the raw body when validation fails
         mock_app.current_event.body = json.dumps(body_input)
 
         result = handler_module.query_endpoint()
@@ -251,8 +284,8 @@ class TestRagQueryHandler:
     def test_query_endpoint_default_srd_id_and_invoke_llm(
         self,
         handler_module: MagicMock,
-        mock_app: MagicMock,
-        mock_processor: MagicMock,
+        mock_app: Mock,
+        mock_processor: SimpleNamespace,
         mock_logger: MagicMock,
     ):
         """Test query_endpoint uses default srd_id and invoke_generative_llm."""
@@ -261,20 +294,19 @@ class TestRagQueryHandler:
 
         handler_module.query_endpoint()
 
-        mock_processor.get_answer_from_rag.assert_called_once_with(
-            query_text="Default test?",
-            srd_id="default_srd_id_value",
-            invoke_generative_llm=False,
-            use_conversational_style=False,
-            generation_config_payload={},
-            lambda_logger=mock_logger,
+        assert_rag_called_once(
+            mock_processor,
+            "Default test?",
+            "default_srd_id_value",
+            False,
+            mock_logger,
         )
 
     def test_query_endpoint_invoke_llm_invalid_type_defaults_to_false(
         self,
         handler_module: MagicMock,
-        mock_app: MagicMock,
-        mock_processor: MagicMock,
+        mock_app: Mock,
+        mock_processor: SimpleNamespace,
         mock_logger: MagicMock,
     ):
         """Test invoke_generative_llm defaults to False if type is invalid."""
@@ -285,19 +317,14 @@ class TestRagQueryHandler:
         }
 
         handler_module.query_endpoint()
-        mock_processor.get_answer_from_rag.assert_called_once_with(
-            query_text="Test query",
-            srd_id="test_srd",
-            invoke_generative_llm=False,
-            use_conversational_style=False,
-            generation_config_payload={},
-            lambda_logger=mock_logger,
+        assert_rag_called_once(
+            mock_processor, "Test query", "test_srd", False, mock_logger
         )
 
     def test_query_endpoint_general_exception(
         self,
         handler_module: MagicMock,
-        mock_app: MagicMock,
+        mock_app: Mock,
         mock_logger: MagicMock,
     ):
         """Test query_endpoint with a general exception during processing."""
@@ -330,8 +357,8 @@ class TestRagQueryHandler:
     def test_query_endpoint_processor_handled_errors(
         self,
         handler_module: MagicMock,
-        mock_app: MagicMock,
-        mock_processor: MagicMock,
+        mock_app: Mock,
+        mock_processor: SimpleNamespace,
         mock_logger: MagicMock,
         processor_return_value: Dict[str, str],
         expected_status_code: int,
@@ -351,8 +378,8 @@ class TestRagQueryHandler:
     def test_query_endpoint_processor_unhandled_exception(
         self,
         handler_module: MagicMock,
-        mock_app: MagicMock,
-        mock_processor: MagicMock,
+        mock_app: Mock,
+        mock_processor: SimpleNamespace,
         mock_logger: MagicMock,
     ):
         """Test query_endpoint when processor.get_answer_from_rag raises unhandled exception."""
@@ -367,40 +394,13 @@ class TestRagQueryHandler:
         assert body["error"] == "Internal server error."
         mock_logger.exception.assert_called_once()
 
-    def test_query_endpoint_name_error_if_json_not_imported(
-        self,
-        handler_module: MagicMock,
-        mock_app: MagicMock,
-        mock_processor: MagicMock,  # Keep processor mocked to avoid other errors
-    ):
-        """
-        Test that a NameError for 'json' occurs if not imported in handler.
-        This test relies on json.dumps being called in an error path.
-        """
-        # Trigger an error path that calls json.dumps
-        mock_processor.s3_client = (
-            None  # Causes 500 error, which calls json.dumps
-        )
+    def test_handler_imports_json(self, handler_module: MagicMock):
+        """Test that handler.py imports json for its error responses."""
+        with open(handler_module.__file__, encoding="utf-8") as handler_file:
+            tree = ast.parse(handler_file.read())
 
-        # If 'json' is not imported in handler.py, this call will raise NameError
-        # We are testing the handler's robustness / completeness of imports.
-        with (
-            patch.dict(
-                handler_module.__dict__,
-                {"json": NameError("json is not defined")},
-            ),
-            pytest.raises(NameError),
-        ):
-            # Temporarily remove 'json' from the handler's scope if it was auto-imported or mocked in
-            if "json" in handler_module.__dict__:
-                original_json = handler_module.json
-                del handler_module.json
-                try:
-                    handler_module.query_endpoint()
-                finally:
-                    handler_module.json = original_json  # Restore
-            else:  # if json was never in its dict (e.g. truly not imported)
-                with pytest.raises(
-                    NameError, match="name 'json' is not defined"
-                ):
-                    handler_module.query_endpoint()
+        assert any(
+            isinstance(node, ast.Import)
+            and any(alias.name == "json" for alias in node.names)
+            for node in ast.walk(tree)
+        )
@@ -1,60 +1,64 @@
 # Standard Library
-import os
-from unittest.mock import patch, MagicMock, call
+import array
+import pickle
+import threading
+from unittest.mock import ANY, patch, MagicMock, call
 
 # Third Party
+import faiss
+import numpy as np
 import pytest
+import zstandard as zstd
 from botocore.exceptions import ClientError
 from aws_lambda_powertools import Logger
 from langchain_community.vectorstores import FAISS
 from langchain_aws import ChatBedrock
-from langchain.chains.retrieval_qa.base import RetrievalQA
 from langchain_core.documents import Document
+from langchain_core.messages import AIMessage
 
 # Local Modules
 from rag_query_processor import processor
 
+# Attribute names for the specced mocks, listed once so that each mock
+# does not have to run dir() over the class again
+LOGGER_SPEC = dir(Logger)
+FAISS_SPEC = dir(FAISS)
+CHAT_BEDROCK_SPEC = dir(ChatBedrock)
+
+# Environment variables the processor reads, and the module attributes
+# derived from them at import time
+PROCESSOR_ENV = {
+    "VECTOR_STORE_BUCKET_NAME": "test-vector-bucket",
+    "QUERY_CACHE_TABLE_NAME": "test-query-cache-table",
+    "BEDROCK_EMBEDDING_MODEL_ID": "amazon.titan-embed-text-v1",
+    "BEDROCK_TEXT_GENERATION_MODEL_ID": "amazon.titan-text-express-v1",
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def processor_env():
+    """Sets default env vars and their module attributes once."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in PROCESSOR_ENV.items():
+            mp.setenv(name, value)
+            mp.setattr(processor, name, value)
+        yield
+
 
 @pytest.fixture(autouse=True)
-def reset_module_globals_and_env(monkeypatch):
-    """Resets mutable global states and sets default env vars."""
+def reset_module_globals(monkeypatch):
+    """Resets mutable global states."""
     # Clear cache and reset global instances
     processor.faiss_index_cache.clear()
-
-    # Use patch for module-level variable
-    with patch.object(processor, "_default_llm_instance", None):
-        # Set environment variables with monkeypatch
-        monkeypatch.setenv("VECTOR_STORE_BUCKET_NAME", "test-vector-bucket")
-        monkeypatch.setenv("QUERY_CACHE_TABLE_NAME", "test-query-cache-table")
-        monkeypatch.setenv(
-            "BEDROCK_EMBEDDING_MODEL_ID", "amazon.titan-embed-text-v1"
-        )
-        monkeypatch.setenv(
-            "BEDROCK_TEXT_GENERATION_MODEL_ID", "amazon.titan-text-express-v1"
-        )
-
-        # Use patch for module-level attributes derived from env vars
-        with patch.multiple(
-            processor,
-            BEDROCK_EMBEDDING_MODEL_ID=os.environ.get(
-                "BEDROCK_EMBEDDING_MODEL_ID", "amazon.titan-embed-text-v1"
-            ),
-            BEDROCK_TEXT_GENERATION_MODEL_ID=os.environ.get(
-                "BEDROCK_TEXT_GENERATION_MODEL_ID",
-                "amazon.titan-text-express-v1",
-            ),
-            VECTOR_STORE_BUCKET_NAME=os.environ.get(
-                "VECTOR_STORE_BUCKET_NAME"
-            ),
-            QUERY_CACHE_TABLE_NAME=os.environ.get("QUERY_CACHE_TABLE_NAME"),
-        ):
-            yield
+    processor._embed_query.cache_clear()
+    processor._chat_bedrock_for.cache_clear()
+    monkeypatch.setattr(processor, "_default_llm_instance", None)
 
 
 @pytest.fixture
 def mock_lambda_logger():
     """Provides a MagicMock for the lambda_logger argument."""
-    return MagicMock(spec=Logger)
+    return MagicMock(spec=LOGGER_SPEC)
 
 
 @pytest.fixture
@@ -103,16 +107,27 @@ def setup_cache_table(mocked_dynamodb):
 
 
 # --- Tests for get_llm_instance ---
-class TestGetLlmInstance:
-    @pytest.fixture
-    def mock_chat_bedrock_class(self):
-        with patch(
-            "rag_query_processor.processor.ChatBedrock", autospec=True
-        ) as mock_class:
-            mock_instance = mock_class.return_value
-            mock_instance._llm_type = "mocked_chat_bedrock"
-            yield mock_class
+@pytest.fixture(scope="class")
+def installed_chat_bedrock_class():
+    # Autospeccing ChatBedrock is slow, so patch it once per test class
+    with patch(
+        "rag_query_processor.processor.ChatBedrock", autospec=True
+    ) as mock_class:
+        mock_instance = mock_class.return_value
+        mock_instance._llm_type = "mocked_chat_bedrock"
+        yield mock_class, mock_instance
 
+
+@pytest.fixture
+def mock_chat_bedrock_class(installed_chat_bedrock_class):
+    mock_class, mock_instance = installed_chat_bedrock_class
+    mock_class.reset_mock(side_effect=True)
+    mock_instance.reset_mock()
+    mock_class.return_value = mock_instance
+    return mock_class
+
+
+class TestGetLlmInstance:
     def test_get_llm_instance_with_full_config(
         self, mock_chat_bedrock_class, mock_boto3_module_clients
     ):
@@ -124,9 +139,9 @@ class TestGetLlmInstance:
         }
         expected_model_kwargs = {
             "temperature": 0.5,
-            "topP": 0.8,
-            "maxTokenCount": 500,
-            "stopSequences": ["\nUser:"],
+            "top_p": 0.8,
+            "max_tokens": 500,
+            "stop_sequences": ["\nUser:"],
         }
 
         llm = processor.get_llm_instance(generation_config)
@@ -136,9 +151,27 @@ class TestGetLlmInstance:
             client=mock_boto3_module_clients["bedrock_runtime"],
             model=processor.BEDROCK_TEXT_GENERATION_MODEL_ID,
             model_kwargs=expected_model_kwargs,
+            beta_use_converse_api=True,
         )
-        with patch.object(processor, "_default_llm_instance", None):
-            assert processor._default_llm_instance is None
+        # The fallback default instance is only built when needed
+        assert processor._default_llm_instance is None
+
+    def test_get_llm_instance_reuses_instance_for_same_config(
+        self, mock_chat_bedrock_class
+    ):
+        generation_config = {"temperature": 0.5, "stopSequences": ["\nUser:"]}
+
+        llm1 = processor.get_llm_instance(generation_config)
+        llm2 = processor.get_llm_instance(dict(generation_config))
+        processor.get_llm_instance({"temperature": 0.7})
+
+        assert llm1 is llm2
+        assert mock_chat_bedrock_class.call_count == 2
+        first_kwargs = mock_chat_bedrock_class.call_args_list[0][1]
+        assert first_kwargs["model_kwargs"] == {
+            "temperature": 0.5,
+            "stop_sequences": ["\nUser:"],
+        }
 
     def test_get_llm_instance_empty_config_uses_default_creation_flow(
         self, mock_chat_bedrock_class, mock_boto3_module_clients
@@ -149,26 +182,25 @@ class TestGetLlmInstance:
             client=mock_boto3_module_clients["bedrock_runtime"],
             model=processor.BEDROCK_TEXT_GENERATION_MODEL_ID,
             model_kwargs={},
+            beta_use_converse_api=True,
         )
-        with patch.object(processor, "_default_llm_instance", None):
-            assert processor._default_llm_instance is None
 
     def test_get_llm_instance_primary_chat_bedrock_init_fails_returns_default(
         self, mock_chat_bedrock_class, mock_boto3_module_clients
     ):
         # Simulate the first ChatBedrock call (dynamic config) failing
         chat_bedrock_side_effects = [
-            Exception("Dynamic init failed"),  # First call fails
-            MagicMock(spec=ChatBedrock),  # Second call (default) succeeds
+            # First call fails
+            Exception("Dynamic init failed"),
+            # Second call (default) succeeds
+            MagicMock(spec=CHAT_BEDROCK_SPEC),
         ]
         mock_chat_bedrock_class.side_effect = chat_bedrock_side_effects
 
-        with patch.object(processor, "_default_llm_instance", None):
-            llm = processor.get_llm_instance({"temperature": 0.1})
+        llm = processor.get_llm_instance({"temperature": 0.1})
 
         assert llm is chat_bedrock_side_effects[1]
-        with patch.object(processor, "_default_llm_instance", llm):
-            assert processor._default_llm_instance is llm
+        assert processor._default_llm_instance is llm
 
         mock_boto3_module_clients[
             "processor_logger"
@@ -183,7 +215,7 @@ class TestGetLlmInstance:
         assert first_call_args[1]["model_kwargs"] == {"temperature": 0.1}
         assert second_call_args[1]["model_kwargs"] == {
             "temperature": 0.1,
-            "maxTokenCount": 1024,
+            "max_tokens": 1024,
         }
 
     def test_get_llm_instance_both_dynamic_and_default_init_fail(
@@ -195,18 +227,16 @@ class TestGetLlmInstance:
             Exception("Default init failed"),
         ]
 
-        with patch.object(processor, "_default_llm_instance", None):
-            # Expect the second exception ("Default init failed") to propagate
-            with pytest.raises(Exception, match="Default init failed"):
-                processor.get_llm_instance({"temperature": 0.1})
+        # Expect the second exception ("Default init failed") to propagate
+        with pytest.raises(Exception, match="Default init failed"):
+            processor.get_llm_instance({"temperature": 0.1})
 
         mock_boto3_module_clients[
             "processor_logger"
         ].exception.assert_called_with(
             "Failed to initialize dynamic ChatBedrock instance: Dynamic init failed"
         )
-        with patch.object(processor, "_default_llm_instance", None):
-            assert processor._default_llm_instance is None
+        assert processor._default_llm_instance is None
         assert mock_chat_bedrock_class.call_count == 2
 
     def test_get_llm_instance_no_bedrock_client_propagates_error(
@@ -309,186 +339,315 @@ class TestGetLlmInstance:
         generation_config = {param: invalid_value}
         # Ensure the primary ChatBedrock call doesn't fail for other reasons
         mock_chat_bedrock_class.side_effect = None
-        mock_chat_bedrock_class.return_value = MagicMock(spec=ChatBedrock)
+        mock_chat_bedrock_class.return_value = MagicMock(
+            spec=CHAT_BEDROCK_SPEC
+        )
 
         processor.get_llm_instance(generation_config)
 
-        found_warning = False
-        for call_args in mock_boto3_module_clients[
-            "processor_logger"
-        ].warning.call_args_list:
-            if expected_warning_part in call_args[0][0]:
-                found_warning = True
-                break
+        all_warnings = "\n".join(
+            call_args[0][0]
+            for call_args in mock_boto3_module_clients[
+                "processor_logger"
+            ].warning.call_args_list
+        )
         assert (
-            found_warning
+            expected_warning_part in all_warnings
         ), f"Expected warning '{expected_warning_part}' not found."
 
         mock_chat_bedrock_class.assert_called_once()
         called_kwargs = mock_chat_bedrock_class.call_args[1].get(
             "model_kwargs", {}
         )
-        assert param not in called_kwargs  # Invalid param should be omitted
+        assert called_kwargs == {}  # Invalid param should be omitted
+
+    def test_get_llm_instance_invalid_param_keeps_valid_params(
+        self, mock_chat_bedrock_class, mock_boto3_module_clients
+    ):
+        processor.get_llm_instance(
+            {"temperature": 1, "topP": "high", "maxTokenCount": 256}
+        )
+
+        called_kwargs = mock_chat_bedrock_class.call_args[1]["model_kwargs"]
+        assert called_kwargs == {"temperature": 1.0, "max_tokens": 256}
+        mock_boto3_module_clients[
+            "processor_logger"
+        ].warning.assert_called_once_with(
+            "Invalid topP value: high. Using default."
+        )
+
+
+# --- Tests for _create_cache_client ---
+class TestCreateCacheClient:
+    def test_no_dax_endpoint_uses_dynamodb(self):
+        with (
+            patch.object(processor, "DAX_ENDPOINT", None),
+            patch.object(processor, "_boto_session") as mock_session,
+        ):
+            client = processor._create_cache_client()
+        mock_session.client.assert_called_once_with(
+            "dynamodb", config=processor.BOTO_CLIENT_CONFIG
+        )
+        assert client is mock_session.client.return_value
+
+    def test_dax_unavailable_falls_back_to_dynamodb(self):
+        with (
+            patch.object(processor, "DAX_ENDPOINT", "dax://cluster:8111"),
+            patch.dict("sys.modules", {"amazondax": None}),
+            patch.object(processor, "_boto_session") as mock_session,
+            patch.object(processor, "logger") as mock_logger,
+        ):
+            client = processor._create_cache_client()
+        assert client is mock_session.client.return_value
+        mock_logger.warning.assert_called_once()
+
+    def test_dax_endpoint_uses_dax_client(self):
+        mock_dax_module = MagicMock()
+        with (
+            patch.object(processor, "DAX_ENDPOINT", "dax://cluster:8111"),
+            patch.dict("sys.modules", {"amazondax": mock_dax_module}),
+        ):
+            client = processor._create_cache_client()
+        mock_dax_module.AmazonDaxClient.assert_called_once_with(
+            endpoint_url="dax://cluster:8111"
+        )
+        assert client is mock_dax_module.AmazonDaxClient.return_value
 
 
 # --- Tests for _load_faiss_index_from_s3 ---
-@pytest.fixture
-def mock_faiss_class():
+@pytest.fixture(scope="class")
+def installed_faiss_class():
+    # Autospeccing FAISS is slow, so patch it once per test class
     with patch(
         "rag_query_processor.processor.FAISS", autospec=True
     ) as mock_class:
-        yield mock_class
+        yield mock_class, mock_class.return_value
 
 
 @pytest.fixture
-def mock_os_module():
-    with patch("rag_query_processor.processor.os", autospec=True) as m:
-        # Default os.path.exists to False unless overridden in a test
-        m.path.exists.return_value = False
-        yield m
+def mock_faiss_class(installed_faiss_class):
+    mock_class, mock_instance = installed_faiss_class
+    mock_class.reset_mock(side_effect=True)
+    mock_instance.reset_mock()
+    mock_class.return_value = mock_instance
+    return mock_class
 
 
 @pytest.fixture
-def mock_shutil_module():
-    with patch("rag_query_processor.processor.shutil", autospec=True) as m:
+def mock_faiss_module():
+    with patch("rag_query_processor.processor.faiss") as m:
         yield m
 
 
+def _write_index_file(bucket, key, filename):
+    """Stand-in for TransferManager.download writing fake index files."""
+    with open(filename, "wb") as f:
+        if key.endswith("index.pkl"):
+            f.write(pickle.dumps(("docstore", {0: "doc-0"})))
+        else:
+            f.write(b"faiss-bytes")
+    return MagicMock()  # The completed transfer future
+
+
 class TestLoadFaissIndexFromS3:
     @pytest.fixture(autouse=True)
     def setup_method_mocks(
         self,
         mock_faiss_class,
-        mock_os_module,
-        mock_shutil_module,
+        mock_faiss_module,
         mock_boto3_module_clients,
+        tmp_path,
     ):
         self.mock_faiss_class_instance = mock_faiss_class
-        self.mock_faiss_load_local_return = MagicMock(spec=FAISS)
-        self.mock_faiss_class_instance.load_local.return_value = (
-            self.mock_faiss_load_local_return
-        )
-        self.os_mock = mock_os_module
-        self.shutil_mock = mock_shutil_module
+        self.mock_faiss_load_return = mock_faiss_class.return_value
+        self.faiss_module = mock_faiss_module
+        self.faiss_module.IO_FLAG_MMAP = 0x2
+        self.faiss_module.IO_FLAG_READ_ONLY = 0x10
         self.s3_client = mock_boto3_module_clients["s3"]
+        self.s3_client.head_object.return_value = {"ETag": '"etag-1"'}
+        self.transfer_manager = MagicMock()
+        self.transfer_manager.download.side_effect = _write_index_file
         self.embedding_model = mock_boto3_module_clients["embedding_model"]
         self.processor_logger = mock_boto3_module_clients["processor_logger"]
-
-        with patch.object(processor, "embedding_model", self.embedding_model):
+        self.local_root = tmp_path
+
+        with (
+            patch.object(processor, "embedding_model", self.embedding_model),
+            patch.object(processor, "FAISS_LOCAL_ROOT", str(tmp_path)),
+            patch(
+                "rag_query_processor.processor.create_transfer_manager"
+            ) as mock_create_transfer_manager,
+        ):
+            self.create_transfer_manager = mock_create_transfer_manager
+            transfer_context = mock_create_transfer_manager.return_value
+            transfer_context.__enter__.return_value = self.transfer_manager
             yield
 
     def test_cache_hit(self, mock_lambda_logger):
         srd_id = "cached_srd"
-        cached_index = MagicMock(spec=FAISS)
-        processor.faiss_index_cache[srd_id] = cached_index
+        cached_index = MagicMock(spec=FAISS_SPEC)
+        processor.faiss_index_cache[srd_id] = (cached_index, 11)
 
         result = processor._load_faiss_index_from_s3(
             srd_id, mock_lambda_logger
         )
         assert result is cached_index
-        self.s3_client.download_file.assert_not_called()
+        self.s3_client.head_object.assert_not_called()
+        self.transfer_manager.download.assert_not_called()
         mock_lambda_logger.info.assert_any_call(
             f"FAISS index for '{srd_id}' found in cache."
         )
 
+    def test_srd_lock_is_shared_per_srd_id(self):
+        lock = processor._faiss_srd_lock("srd")
+        assert processor._faiss_srd_lock("srd") is lock
+        assert processor._faiss_srd_lock("other_srd") is not lock
+
+    def test_load_is_not_blocked_by_other_srd(self, mock_lambda_logger):
+        # Stands in for a prefetch of another SRD that is still running
+        with processor._faiss_srd_lock("other_srd"):
+            loader = threading.Thread(
+                target=processor._load_faiss_index_from_s3,
+                args=("srd", mock_lambda_logger),
+            )
+            loader.start()
+            loader.join(timeout=5)
+            assert not loader.is_alive()
+
+        assert "srd" in processor.faiss_index_cache
+
     def test_cache_miss_success(self, mock_lambda_logger):
         srd_id = "new_srd"
-        # os.path.exists: False (initial check), True (finally block)
-        self.os_mock.path.exists.side_effect = [False, True]
+        local_dir = self.local_root / f"{srd_id}_faiss_index_query"
 
         result = processor._load_faiss_index_from_s3(
             srd_id, mock_lambda_logger
         )
 
-        assert result is self.mock_faiss_load_local_return
-
-        safe_srd_id = "".join(
-            c if c.isalnum() or c in ["-", "_"] else "_" for c in srd_id
-        )
-        expected_local_dir = f"/tmp/{safe_srd_id}_faiss_index_query"
-
-        self.os_mock.path.exists.assert_any_call(expected_local_dir)
-        self.os_mock.makedirs.assert_called_once_with(
-            expected_local_dir, exist_ok=True
-        )
-
-        # shutil.rmtree should not be called for pre-cleanup
-        # Call for final cleanup
-        self.shutil_mock.rmtree.assert_called_once_with(expected_local_dir)
+        assert result is self.mock_faiss_load_return
 
         expected_s3_key_prefix = f"{srd_id}/faiss_index"
+        self.s3_client.head_object.assert_called_once_with(
+            Bucket="test-vector-bucket",
+            Key=f"{expected_s3_key_prefix}/index.faiss",
+        )
         expected_dl_calls = [
             call(
                 "test-vector-bucket",
-                f"{expected_s3_key_prefix}/index.faiss",
-                self.os_mock.path.join(expected_local_dir, "index.faiss"),
-            ),
-            call(
-                "test-vector-bucket",
-                f"{expected_s3_key_prefix}/index.pkl",
-                self.os_mock.path.join(expected_local_dir, "index.pkl"),
-            ),
+                f"{expected_s3_key_prefix}/{file_name}",
+                str(local_dir / file_name),
+            )
+            for file_name in ("index.faiss", "index.pkl")
         ]
-        self.s3_client.download_file.assert_has_calls(
+        self.create_transfer_manager.assert_called_once_with(
+            self.s3_client, processor.FAISS_TRANSFER_CONFIG
+        )
+        self.transfer_manager.download.assert_has_calls(
             expected_dl_calls, any_order=True
         )
-        assert self.s3_client.download_file.call_count == 2
+        assert self.transfer_manager.download.call_count == 2
+        assert (local_dir / ".etag").read_text() == '"etag-1"'
+
+        # The index is memory-mapped read-only from the local copy
+        self.faiss_module.read_index.assert_called_once_with(
+            str(local_dir / "index.faiss"), 0x2 | 0x10
+        )
 
-        self.mock_faiss_class_instance.load_local.assert_called_once_with(
-            folder_path=expected_local_dir,
-            embeddings=self.embedding_model,
-            allow_dangerous_deserialization=True,
+        self.mock_faiss_class_instance.assert_called_once_with(
+            embedding_function=self.embedding_model,
+            index=self.faiss_module.read_index.return_value,
+            docstore="docstore",
+            index_to_docstore_id={0: "doc-0"},
         )
-        assert processor.faiss_index_cache[srd_id] is result
+        assert processor.faiss_index_cache[srd_id] == (result, 11)
 
-    def test_cache_miss_success_local_dir_exists_initially(
+    def test_unchanged_index_on_disk_is_not_downloaded(
         self, mock_lambda_logger
     ):
-        srd_id = "existing_dir_srd"
-        # os.path.exists: True (initial check), True (finally block)
-        self.os_mock.path.exists.return_value = (
-            True  # Always True for this test
-        )
+        processor._load_faiss_index_from_s3("srd", mock_lambda_logger)
+        processor.faiss_index_cache.clear()
+        self.transfer_manager.download.reset_mock()
 
-        processor._load_faiss_index_from_s3(srd_id, mock_lambda_logger)
+        result = processor._load_faiss_index_from_s3("srd", mock_lambda_logger)
 
-        safe_srd_id = "".join(
-            c if c.isalnum() or c in ["-", "_"] else "_" for c in srd_id
+        assert result is self.mock_faiss_load_return
+        self.transfer_manager.download.assert_not_called()
+        mock_lambda_logger.info.assert_any_call(
+            "FAISS index for 'srd' is current on local disk."
         )
-        expected_local_dir = f"/tmp/{safe_srd_id}_faiss_index_query"
 
-        expected_rmtree_calls = [
-            call(expected_local_dir),  # Pre-cleanup
-            call(expected_local_dir),  # Final cleanup
-        ]
-        self.shutil_mock.rmtree.assert_has_calls(expected_rmtree_calls)
-        assert self.shutil_mock.rmtree.call_count == 2
-        self.os_mock.makedirs.assert_called_once_with(
-            expected_local_dir, exist_ok=True
+    def test_local_dir_name_is_sanitized(self, mock_lambda_logger):
+        processor._load_faiss_index_from_s3("../my srd", mock_lambda_logger)
+
+        local_dir = self.local_root / "___my_srd_faiss_index_query"
+        assert (local_dir / "index.faiss").exists()
+
+    def test_refresh_holds_directory_lock(self, mock_lambda_logger):
+        with patch("rag_query_processor.processor.fcntl") as mock_fcntl:
+            processor._load_faiss_index_from_s3("srd", mock_lambda_logger)
+
+        mock_fcntl.flock.assert_called_once_with(ANY, mock_fcntl.LOCK_EX)
+        lock_file = mock_fcntl.flock.call_args[0][0]
+        assert lock_file.name == str(
+            self.local_root / "srd_faiss_index_query" / ".lock"
         )
 
-    def test_cache_eviction(self, mock_lambda_logger):
-        with patch.object(processor, "MAX_CACHE_SIZE", 1):
-            # os.path.exists: [False, True] for first load, [False, True] for second
-            self.os_mock.path.exists.side_effect = [False, True, False, True]
+    def test_changed_index_is_downloaded_again(self, mock_lambda_logger):
+        processor._load_faiss_index_from_s3("srd", mock_lambda_logger)
+        processor.faiss_index_cache.clear()
+        self.transfer_manager.download.reset_mock()
+        self.s3_client.head_object.return_value = {"ETag": '"etag-2"'}
+
+        processor._load_faiss_index_from_s3("srd", mock_lambda_logger)
 
+        assert self.transfer_manager.download.call_count == 2
+        etag_path = self.local_root / "srd_faiss_index_query" / ".etag"
+        assert etag_path.read_text() == '"etag-2"'
+
+    def test_cache_eviction(self, mock_lambda_logger):
+        # Each fake index file is 11 bytes, so two do not fit the budget
+        with patch.object(processor, "FAISS_CACHE_BYTES", 15):
             processor._load_faiss_index_from_s3(
                 "srd1", mock_lambda_logger
             )  # First load
-            self.mock_faiss_class_instance.load_local.reset_mock()  # Reset for second load
 
-            new_faiss_instance = MagicMock(spec=FAISS)
-            self.mock_faiss_class_instance.load_local.return_value = (
-                new_faiss_instance
-            )
+            new_faiss_instance = MagicMock(spec=FAISS_SPEC)
+            self.mock_faiss_class_instance.return_value = new_faiss_instance
 
             processor._load_faiss_index_from_s3(
                 "srd2", mock_lambda_logger
-            )  # Second load, causes eviction
+            )  # Second load, goes over budget and causes eviction
 
-            assert "srd2" in processor.faiss_index_cache
-            assert "srd1" not in processor.faiss_index_cache
-            assert processor.faiss_index_cache["srd2"] is new_faiss_instance
+            assert list(processor.faiss_index_cache) == ["srd2"]
+            assert processor.faiss_index_cache["srd2"][0] is new_faiss_instance
+            mock_lambda_logger.info.assert_any_call(
+                "Evicted FAISS index for 'srd1' from cache."
+            )
+
+    def test_cache_eviction_is_lru(self, mock_lambda_logger):
+        processor.faiss_index_cache["srd1"] = (
+            MagicMock(spec=FAISS_SPEC),
+            11,
+        )
+        processor.faiss_index_cache["srd2"] = (
+            MagicMock(spec=FAISS_SPEC),
+            11,
+        )
+
+        with patch.object(processor, "FAISS_CACHE_BYTES", 30):
+            # A cache hit marks srd1 as most recently used
+            processor._load_faiss_index_from_s3("srd1", mock_lambda_logger)
+            processor._load_faiss_index_from_s3("srd3", mock_lambda_logger)
+
+        assert list(processor.faiss_index_cache) == ["srd1", "srd3"]
+
+    def test_oversized_index_is_still_cached(self, mock_lambda_logger):
+        with patch.object(processor, "FAISS_CACHE_BYTES", 5):
+            result = processor._load_faiss_index_from_s3(
+                "srd_big", mock_lambda_logger
+            )
+
+        assert processor.faiss_index_cache == {"srd_big": (result, 11)}
 
     @pytest.mark.parametrize(
         "missing_attr,log_msg_part,is_processor_attr",
@@ -525,28 +684,73 @@ class TestLoadFaissIndexFromS3:
             mock_lambda_logger.error.assert_called_with(log_msg_part)
 
     def test_s3_download_fails(self, mock_lambda_logger):
-        self.s3_client.download_file.side_effect = ClientError({}, "Op")
-        # os.path.exists: False (initial), True (finally)
-        self.os_mock.path.exists.side_effect = [False, True]
+        failed_download = MagicMock()
+        failed_download.result.side_effect = ClientError({}, "Op")
+        self.transfer_manager.download.side_effect = None
+        self.transfer_manager.download.return_value = failed_download
         result = processor._load_faiss_index_from_s3(
             "srd_dl_fail", mock_lambda_logger
         )
         assert result is None
         mock_lambda_logger.exception.assert_called()
-        self.shutil_mock.rmtree.assert_called_once()  # Ensure cleanup still happens
+        assert "srd_dl_fail" not in processor.faiss_index_cache
+        etag_path = self.local_root / "srd_dl_fail_faiss_index_query" / ".etag"
+        assert not etag_path.exists()
 
-    def test_faiss_load_local_fails(self, mock_lambda_logger):
-        self.mock_faiss_class_instance.load_local.side_effect = Exception(
+    def test_faiss_read_index_fails(self, mock_lambda_logger):
+        self.faiss_module.read_index.side_effect = Exception(
             "FAISS load error"
         )
-        # os.path.exists: False (initial), True (finally)
-        self.os_mock.path.exists.side_effect = [False, True]
         result = processor._load_faiss_index_from_s3(
             "srd_faiss_fail", mock_lambda_logger
         )
         assert result is None
         mock_lambda_logger.exception.assert_called()
-        self.shutil_mock.rmtree.assert_called_once()
+        self.mock_faiss_class_instance.assert_not_called()
+
+    def test_failed_load_drops_local_copy(self, mock_lambda_logger):
+        self.faiss_module.read_index.side_effect = [
+            Exception("Corrupt index"),
+            MagicMock(),
+        ]
+        local_dir = self.local_root / "srd_bad_faiss_index_query"
+
+        processor._load_faiss_index_from_s3("srd_bad", mock_lambda_logger)
+        assert not local_dir.exists()
+
+        # The next load fetches the files again despite the unchanged ETag
+        result = processor._load_faiss_index_from_s3(
+            "srd_bad", mock_lambda_logger
+        )
+        assert result is self.mock_faiss_load_return
+        assert self.transfer_manager.download.call_count == 4
+
+    def test_disk_full_streams_index_from_s3(self, mock_lambda_logger):
+        self.transfer_manager.download.side_effect = OSError(
+            28, "No space left on device"
+        )
+        faiss_body = MagicMock()
+        pkl_body = MagicMock()
+        pkl_body.read.return_value = pickle.dumps(({}, {}))
+        self.s3_client.get_object.side_effect = [
+            {"Body": faiss_body, "ContentLength": 11},
+            {"Body": pkl_body},
+        ]
+
+        result = processor._load_faiss_index_from_s3(
+            "srd_full", mock_lambda_logger
+        )
+
+        assert result is self.mock_faiss_load_return
+        self.faiss_module.PyCallbackIOReader.assert_called_once_with(
+            faiss_body.read, processor.FAISS_STREAM_BLOCK_SIZE
+        )
+        self.faiss_module.read_index.assert_called_once_with(
+            self.faiss_module.PyCallbackIOReader.return_value
+        )
+        assert not (self.local_root / "srd_full_faiss_index_query").exists()
+        assert processor.faiss_index_cache["srd_full"][1] == 11
+        mock_lambda_logger.warning.assert_called_once()
 
 
 # --- Fixtures for TestGetAnswerFromRag ---
@@ -562,38 +766,179 @@ def mock_processor_get_llm_instance():
         yield m
 
 
-@pytest.fixture
-def mock_retrieval_qa_class():
-    with patch(
-        "rag_query_processor.processor.RetrievalQA", autospec=True
-    ) as m:
-        yield m
+# Time returned by mock_time_module, and cache items that are still valid
+# or already expired at that time
+FROZEN_TIME = 1700000000
+CACHED_VALID_ITEM = {
+    "Item": {
+        "answer": {"S": "cached"},
+        "ttl": {"N": str(FROZEN_TIME + 100)},
+    }
+}
+CACHED_EXPIRED_ITEM = {
+    "Item": {
+        "answer": {"S": "expired"},
+        "ttl": {"N": str(FROZEN_TIME - 100)},
+    }
+}
 
 
-@pytest.fixture
-def mock_prompt_template_class():
-    with patch(
-        "rag_query_processor.processor.PromptTemplate", autospec=True
-    ) as m:
-        yield m
+class FrozenTime:
+    """Stands in for the time module; the processor only calls time()."""
+
+    @staticmethod
+    def time() -> float:
+        return float(FROZEN_TIME)
 
 
 @pytest.fixture
-def mock_time_module():
-    with patch("rag_query_processor.processor.time") as m:
-        m.time.return_value = 1700000000.0
-        yield m
+def mock_time_module(monkeypatch):
+    monkeypatch.setattr(processor, "time", FrozenTime)
+    return FrozenTime
 
 
 @pytest.fixture
-def mock_hashlib_md5():
-    with patch("rag_query_processor.processor.hashlib.md5") as m:
+def mock_hashlib_blake2b():
+    with patch("rag_query_processor.processor.hashlib.blake2b") as m:
         mock_hash_obj = MagicMock()
         mock_hash_obj.hexdigest.return_value = "mocked_query_hash"
         m.return_value = mock_hash_obj
         yield m
 
 
+# --- Tests for _tune_faiss_index ---
+class TestTuneFaissIndex:
+    @pytest.mark.parametrize("nlist, nprobe", [(16, 8), (400, 20)])
+    def test_ivf_nprobe_scales_with_nlist(self, nlist, nprobe):
+        index = faiss.IndexIVFFlat(faiss.IndexFlatL2(4), 4, nlist)
+        processor._tune_faiss_index(index)
+        assert index.nprobe == nprobe
+
+    def test_non_ivf_index_search_is_unchanged(self):
+        vectors = np.random.default_rng(0).random((20, 4), dtype="float32")
+        index = faiss.IndexFlatL2(4)
+        index.add(vectors)
+        expected = index.search(vectors[:3], 5)
+
+        processor._tune_faiss_index(index)
+
+        for before, after in zip(expected, index.search(vectors[:3], 5)):
+            np.testing.assert_array_equal(after, before)
+
+    def test_ivf_behind_pre_transform_is_tuned(self):
+        index = faiss.index_factory(8, "PCA4,IVF16,Flat")
+        assert isinstance(index, faiss.IndexPreTransform)
+
+        processor._tune_faiss_index(index)
+
+        assert faiss.extract_index_ivf(index).nprobe == 8
+
+
+# --- Tests for _join_truncated ---
+@pytest.mark.parametrize(
+    "parts, limit",
+    [
+        (["a" * 10, "b" * 10, "c" * 10], 1000),
+        (["a" * 10, "b" * 10, "c" * 10], 11),
+        (["a" * 10, "b" * 10, "c" * 10], 12),
+        (["a" * 2000, "b" * 10], 1000),
+        ([], 1000),
+    ],
+)
+def test_join_truncated_matches_sliced_join(parts, limit):
+    assert processor._join_truncated(parts, "; ", limit) == (
+        "; ".join(parts)[:limit]
+    )
+
+
+# --- Tests for _embed_query ---
+class TestEmbedQuery:
+    @pytest.fixture(autouse=True)
+    def setup_method_mocks(self, mock_boto3_module_clients):
+        self.embedding_model = mock_boto3_module_clients["embedding_model"]
+        self.embedding_model.embed_query.return_value = [0.5, -0.25]
+        self.dynamodb_client = mock_boto3_module_clients["dynamodb"]
+        self.dynamodb_client.get_item.return_value = {}
+
+        # Run cache writes inline so they can be asserted on
+        with patch.object(
+            processor,
+            "_cache_write_executor",
+            MagicMock(submit=lambda fn, *args: fn(*args)),
+        ):
+            yield
+
+    def test_repeated_query_is_embedded_once(self, mock_lambda_logger):
+        first = processor._embed_query("q", mock_lambda_logger)
+        second = processor._embed_query("q", mock_lambda_logger)
+
+        assert first == second == (0.5, -0.25)
+        self.embedding_model.embed_query.assert_called_once_with("q")
+        self.dynamodb_client.get_item.assert_called_once()
+
+    def test_l2_miss_embeds_and_stores_packed_vector(self, mock_lambda_logger):
+        processor._embed_query("q", mock_lambda_logger)
+
+        self.dynamodb_client.put_item.assert_called_once()
+        item = self.dynamodb_client.put_item.call_args.kwargs["Item"]
+        assert item["query_hash"]["S"].startswith("emb#")
+        assert len(item["query_hash"]["S"]) == len("emb#") + 32
+        assert (
+            item["embedding"]["B"] == array.array("f", [0.5, -0.25]).tobytes()
+        )
+
+    def test_l2_put_is_submitted_to_background_executor(
+        self, mock_lambda_logger
+    ):
+        with patch.object(processor, "_cache_write_executor") as mock_executor:
+            result = processor._embed_query("q", mock_lambda_logger)
+
+        assert result == (0.5, -0.25)
+        mock_executor.submit.assert_called_once_with(
+            processor._put_cached_embedding,
+            ANY,
+            [0.5, -0.25],
+            mock_lambda_logger,
+        )
+        self.dynamodb_client.put_item.assert_not_called()
+
+    def test_l2_put_error_logs_warning(self, mock_lambda_logger):
+        self.dynamodb_client.put_item.side_effect = Exception("Boom")
+
+        assert processor._embed_query("q", mock_lambda_logger) == (0.5, -0.25)
+        mock_lambda_logger.warning.assert_called_once_with(
+            "Error caching embedding: Boom."
+        )
+
+    def test_l2_hit_skips_bedrock(self, mock_lambda_logger):
+        self.dynamodb_client.get_item.return_value = {
+            "Item": {
+                "embedding": {"B": array.array("f", [1.0, 2.0]).tobytes()}
+            }
+        }
+
+        assert processor._embed_query("q", mock_lambda_logger) == (1.0, 2.0)
+        self.embedding_model.embed_query.assert_not_called()
+        self.dynamodb_client.put_item.assert_not_called()
+
+    def test_l2_error_falls_back_to_bedrock(self, mock_lambda_logger):
+        self.dynamodb_client.get_item.side_effect = ClientError({}, "Op")
+
+        assert processor._embed_query("q", mock_lambda_logger) == (
+            0.5,
+            -0.25,
+        )
+        self.embedding_model.embed_query.assert_called_once_with("q")
+        mock_lambda_logger.warning.assert_called_once()
+
+    def test_no_cache_table_skips_l2(self, mock_lambda_logger):
+        with patch.object(processor, "QUERY_CACHE_TABLE_NAME", None):
+            processor._embed_query("q", mock_lambda_logger)
+
+        self.dynamodb_client.get_item.assert_not_called()
+        self.dynamodb_client.put_item.assert_not_called()
+
+
 # --- Tests for get_answer_from_rag ---
 class TestGetAnswerFromRag:
     @pytest.fixture(autouse=True)
@@ -601,44 +946,44 @@ class TestGetAnswerFromRag:
         self,
         mock_processor_load_faiss_index,
         mock_processor_get_llm_instance,
-        mock_retrieval_qa_class,
-        mock_prompt_template_class,
         mock_time_module,
-        mock_hashlib_md5,
+        mock_hashlib_blake2b,
         mock_boto3_module_clients,
     ):
         self.load_faiss_index = mock_processor_load_faiss_index
-        self.mock_faiss_store = MagicMock(spec=FAISS)
-        # Mock retriever instance that will be returned by faiss_store.as_retriever()
-        self.mock_retriever = MagicMock()
-        self.mock_retriever.invoke.return_value = [
+        self.mock_faiss_store = MagicMock(spec=FAISS_SPEC)
+        self.mock_faiss_store.similarity_search_by_vector.return_value = [
             Document(page_content="Doc1"),
             Document(page_content="Doc2"),
         ]
-        self.mock_faiss_store.as_retriever.return_value = self.mock_retriever
         self.load_faiss_index.return_value = self.mock_faiss_store
 
         self.get_llm_instance = mock_processor_get_llm_instance
-        self.mock_llm = MagicMock(spec=ChatBedrock)
+        self.mock_llm = MagicMock(spec=CHAT_BEDROCK_SPEC)
+        self.mock_llm.invoke.return_value = AIMessage(content="LLM Answer")
         self.get_llm_instance.return_value = self.mock_llm
 
-        self.retrieval_qa_class = mock_retrieval_qa_class
-        self.mock_qa_chain = MagicMock(spec=RetrievalQA)
-        self.mock_qa_chain.invoke.return_value = {
-            "result": "LLM Answer",
-            "source_documents": [Document(page_content="SourceDoc")],
-        }
-        self.retrieval_qa_class.from_chain_type.return_value = (
-            self.mock_qa_chain
-        )
-
-        self.prompt_template_class = mock_prompt_template_class
         self.s3_client = mock_boto3_module_clients["s3"]
         self.dynamodb_client = mock_boto3_module_clients["dynamodb"]
+        self.embedding_model = mock_boto3_module_clients["embedding_model"]
+        self.embedding_model.embed_query.return_value = [0.1, 0.2]
         self.time_module = mock_time_module
-        self.hashlib_md5 = mock_hashlib_md5
+        self.hashlib_blake2b = mock_hashlib_blake2b
 
-        with patch.object(processor, "CACHE_TTL_SECONDS", 3600):
+        # The query embedding cache is covered by TestEmbedQuery
+        with (
+            patch.object(processor, "CACHE_TTL_SECONDS", 3600),
+            patch.object(
+                processor, "_get_cached_embedding", return_value=None
+            ),
+            patch.object(processor, "_put_cached_embedding"),
+            # Run cache writes inline so they can be asserted on
+            patch.object(
+                processor,
+                "_cache_write_executor",
+                MagicMock(submit=lambda fn, *args: fn(*args)),
+            ),
+        ):
             # Ensure processor's own logger is the mocked one for assertions
             self.processor_logger = mock_boto3_module_clients[
                 "processor_logger"
@@ -674,13 +1019,7 @@ class TestGetAnswerFromRag:
                 )
 
     def test_cache_hit_valid(self, mock_lambda_logger):
-        cached_item = {
-            "Item": {
-                "answer": {"S": "cached"},
-                "ttl": {"N": str(int(self.time_module.time() + 100))},
-            }
-        }
-        self.dynamodb_client.get_item.return_value = cached_item
+        self.dynamodb_client.get_item.return_value = CACHED_VALID_ITEM
         result = processor.get_answer_from_rag(
             "q",
             "srd",
@@ -690,16 +1029,38 @@ class TestGetAnswerFromRag:
             mock_lambda_logger,  # invoke_generative_llm = True for cache
         )
         assert result == {"answer": "cached", "source": "cache"}
-        self.load_faiss_index.assert_not_called()
+        self.dynamodb_client.get_item.assert_called_once_with(
+            TableName="test-query-cache-table",
+            Key={"query_hash": {"S": "mocked_query_hash"}},
+            ProjectionExpression="#z, #a, #t",
+            ExpressionAttributeNames={
+                "#z": "answer_zstd",
+                "#a": "answer",
+                "#t": "ttl",
+            },
+            ConsistentRead=False,
+        )
+        # The index load overlaps the lookup but the LLM is never reached
+        self.get_llm_instance.assert_not_called()
+        self.mock_llm.invoke.assert_not_called()
 
-    def test_cache_hit_expired_proceeds(self, mock_lambda_logger):
-        cached_item = {
+    def test_cache_hit_compressed_answer(self, mock_lambda_logger):
+        self.dynamodb_client.get_item.return_value = {
             "Item": {
-                "answer": {"S": "expired"},
-                "ttl": {"N": str(int(self.time_module.time() - 100))},
+                "answer_zstd": {
+                    "B": zstd.ZstdCompressor().compress(b"compressed")
+                },
+                "ttl": {"N": str(FROZEN_TIME + 100)},
             }
         }
-        self.dynamodb_client.get_item.return_value = cached_item
+        result = processor.get_answer_from_rag(
+            "q", "srd", True, False, {}, mock_lambda_logger
+        )
+        assert result == {"answer": "compressed", "source": "cache"}
+        self.mock_llm.invoke.assert_not_called()
+
+    def test_cache_hit_expired_proceeds(self, mock_lambda_logger):
+        self.dynamodb_client.get_item.return_value = CACHED_EXPIRED_ITEM
         processor.get_answer_from_rag(
             "q", "srd", True, False, {}, mock_lambda_logger
         )
@@ -725,7 +1086,7 @@ class TestGetAnswerFromRag:
         cached_item = {
             "Item": {
                 "not_answer": {"X": "this is not valid json"},
-                "ttl": {"N": str(int(self.time_module.time() + 100))},
+                "ttl": {"N": str(FROZEN_TIME + 100)},
             }
         }
         self.dynamodb_client.get_item.return_value = cached_item
@@ -776,12 +1137,11 @@ class TestGetAnswerFromRag:
             + mock_lambda_logger.info.call_args_list
             + mock_lambda_logger.exception.call_args_list  # if it becomes an exception
         )
-        found_log = any(
-            log_message_part in str(call_args[0])
-            for call_args in all_log_calls
+        all_log_messages = "\n".join(
+            str(call_args[0][0]) for call_args in all_log_calls
         )
         assert (
-            found_log
+            log_message_part in all_log_messages
         ), f"Expected log containing '{log_message_part}' not found."
 
         self.load_faiss_index.assert_called_once()  # Should proceed as cache miss
@@ -798,7 +1158,7 @@ class TestGetAnswerFromRag:
             )
             self.dynamodb_client.get_item.assert_not_called()
             self.load_faiss_index.assert_called_once()
-            self.dynamodb_client.put_item.assert_not_called()
+            self.dynamodb_client.update_item.assert_not_called()
             mock_lambda_logger.warning.assert_any_call(
                 "QUERY_CACHE_TABLE_NAME not set; Bedrock LLM response caching will be disabled."
             )
@@ -811,37 +1171,47 @@ class TestGetAnswerFromRag:
         assert "error" in result
         assert "Could not load SRD data for 'srd_fail'" in result["error"]
 
-    def test_get_answer_from_rag_retriever_creation_fails(
-        self, mock_lambda_logger
+    @pytest.mark.parametrize("invoke_llm", [True, False])
+    def test_get_answer_from_rag_similarity_search_fails(
+        self, invoke_llm, mock_lambda_logger
     ):
-        self.mock_faiss_store.as_retriever.side_effect = Exception(
-            "Retriever error"
+        self.mock_faiss_store.similarity_search_by_vector.side_effect = (
+            Exception("Search error")
         )
         result = processor.get_answer_from_rag(
-            "q_ret_err", "srd_ret", False, False, {}, mock_lambda_logger
+            "q_ret_err", "srd_ret", invoke_llm, False, {}, mock_lambda_logger
         )
         assert "error" in result
         assert (
             "Failed to prepare for information retrieval." in result["error"]
         )
         mock_lambda_logger.exception.assert_called_with(
-            "Error creating retriever: Retriever error"
+            "Error during similarity search: Search error"
         )
+        self.get_llm_instance.assert_not_called()
 
     def test_no_llm_invocation_success(self, mock_lambda_logger):
         result = processor.get_answer_from_rag(
             "q_docs", "srd", False, False, {}, mock_lambda_logger
         )
-        assert "Doc1" in result["answer"] and "Doc2" in result["answer"]
+        assert result["answer"] == (
+            "Based on the retrieved SRD content for your query 'q_docs':\n"
+            "Doc1\n\n---\n\nDoc2"
+        )
         assert result["source"] == "retrieval_only"
+        # The query is embedded once and searched by vector
+        self.embedding_model.embed_query.assert_called_once_with("q_docs")
+        self.mock_faiss_store.similarity_search_by_vector.assert_called_once_with(
+            [0.1, 0.2], k=4
+        )
         self.get_llm_instance.assert_not_called()
         # No caching if LLM not invoked
-        self.dynamodb_client.put_item.assert_not_called()
+        self.dynamodb_client.update_item.assert_not_called()
 
     def test_get_answer_from_rag_no_llm_no_docs_retrieved(
         self, mock_lambda_logger
     ):
-        self.mock_retriever.invoke.return_value = []  # No docs
+        self.mock_faiss_store.similarity_search_by_vector.return_value = []
 
         result = processor.get_answer_from_rag(
             "q_no_docs", "srd_no_docs", False, False, {}, mock_lambda_logger
@@ -852,7 +1222,7 @@ class TestGetAnswerFromRag:
             in result["answer"]
         )
         assert result["source"] == "retrieval_only"
-        self.dynamodb_client.put_item.assert_not_called()
+        self.dynamodb_client.update_item.assert_not_called()
 
     def test_llm_invocation_get_llm_fails(self, mock_lambda_logger):
         self.get_llm_instance.return_value = None
@@ -873,18 +1243,35 @@ class TestGetAnswerFromRag:
         )
         assert result["answer"] == "LLM Answer"
         assert result["source"] == "bedrock_llm"
-        self.retrieval_qa_class.from_chain_type.assert_called_once()
+        assert result["source_documents_retrieved"] == 2
+
+        # Retrieval always embeds the raw query, exactly once
+        self.embedding_model.embed_query.assert_called_once_with(query)
 
         expected_query_to_llm = (
             f"User: {query}\nBot:" if conversational else query
         )
-        self.mock_qa_chain.invoke.assert_called_once_with(
-            {"query": expected_query_to_llm}
+        self.mock_llm.invoke.assert_called_once_with(
+            processor.PROMPT.format(
+                context="Doc1\n\nDoc2", question=expected_query_to_llm
+            )
         )
-        self.dynamodb_client.put_item.assert_called_once()
+        self.dynamodb_client.update_item.assert_called_once()
+
+    def test_empty_llm_answer_is_cached_briefly(self, mock_lambda_logger):
+        self.mock_llm.invoke.return_value = AIMessage(content="")
+        result = processor.get_answer_from_rag(
+            "q", "srd", True, False, {}, mock_lambda_logger
+        )
+        assert result["answer"] == "No answer generated."
+
+        kwargs = self.dynamodb_client.update_item.call_args.kwargs
+        values = kwargs["ExpressionAttributeValues"].values()
+        assert {"N": str(FROZEN_TIME + 120)} in values
+        assert {"BOOL": True} in values
 
     def test_llm_chain_invoke_client_error(self, mock_lambda_logger):
-        self.mock_qa_chain.invoke.side_effect = ClientError(
+        self.mock_llm.invoke.side_effect = ClientError(
             {
                 "Error": {
                     "Code": "ThrottlingException",
@@ -908,7 +1295,7 @@ class TestGetAnswerFromRag:
     def test_llm_chain_invoke_fails_general_exception(
         self, mock_lambda_logger
     ):
-        self.mock_qa_chain.invoke.side_effect = Exception("Chain error")
+        self.mock_llm.invoke.side_effect = Exception("Chain error")
         result = processor.get_answer_from_rag(
             "q_llm", "srd", True, False, {}, mock_lambda_logger
         )
@@ -921,8 +1308,8 @@ class TestGetAnswerFromRag:
             "Error during RAG chain execution: Chain error"
         )
 
-    def test_cache_put_item_fails_logs_warning(self, mock_lambda_logger):
-        self.dynamodb_client.put_item.side_effect = ClientError({}, "Op")
+    def test_cache_update_item_fails_logs_warning(self, mock_lambda_logger):
+        self.dynamodb_client.update_item.side_effect = ClientError({}, "Op")
         result = processor.get_answer_from_rag(
             "q_put_err",
             "srd_put",
@@ -933,6 +1320,87 @@ class TestGetAnswerFromRag:
         )
         assert result["answer"] == "LLM Answer"  # Still returns the result
         mock_lambda_logger.warning.assert_any_call(
-            "DynamoDB cache put_item error: An error occurred (Unknown) when "
-            "calling the Op operation: Unknown. Response not cached."
+            "DynamoDB cache update_item error: An error occurred (Unknown) "
+            "when calling the Op operation: Unknown. Response not cached."
+        )
+
+    def test_cache_write_is_conditional_update(self, mock_lambda_logger):
+        processor.get_answer_from_rag(
+            "q", "srd", True, False, {}, mock_lambda_logger
+        )
+
+        kwargs = self.dynamodb_client.update_item.call_args.kwargs
+        assert kwargs["Key"] == {"query_hash": {"S": "mocked_query_hash"}}
+        assert kwargs["ConditionExpression"] == (
+            "attribute_not_exists(query_hash) OR #ttl < :now"
+        )
+        assert kwargs["ExpressionAttributeValues"][":now"] == {
+            "N": str(FROZEN_TIME)
+        }
+        assert kwargs["ReturnConsumedCapacity"] == "NONE"
+        # Every non-key attribute is set through a placeholder pair
+        names = kwargs["ExpressionAttributeNames"]
+        values = kwargs["ExpressionAttributeValues"]
+        assigned = {
+            names[name]: values[value]
+            for name, value in (
+                assignment.split(" = ")
+                for assignment in kwargs["UpdateExpression"]
+                .removeprefix("SET ")
+                .split(", ")
+            )
+        }
+        assert "query_hash" not in assigned
+        assert assigned["srd_id"] == {"S": "srd"}
+        assert assigned["ttl"] == {"N": str(FROZEN_TIME + 3600)}
+
+    def test_cache_write_skipped_when_already_cached(self, mock_lambda_logger):
+        self.dynamodb_client.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}},
+            "UpdateItem",
+        )
+        result = processor.get_answer_from_rag(
+            "q", "srd", True, False, {}, mock_lambda_logger
+        )
+        assert result["answer"] == "LLM Answer"
+        mock_lambda_logger.info.assert_any_call(
+            "Response already cached for query_hash: mocked_query_hash"
+        )
+        mock_lambda_logger.warning.assert_not_called()
+
+    def test_cache_put_unexpected_error_logs_warning(self, mock_lambda_logger):
+        self.dynamodb_client.update_item.side_effect = Exception("Boom")
+        result = processor.get_answer_from_rag(
+            "q_put_err", "srd_put", True, False, {}, mock_lambda_logger
+        )
+        assert result["answer"] == "LLM Answer"
+        mock_lambda_logger.warning.assert_any_call(
+            "Error caching response: Boom. Response not cached."
+        )
+
+    def test_cache_put_is_submitted_to_background_executor(
+        self, mock_lambda_logger
+    ):
+        with patch.object(processor, "_cache_write_executor") as mock_executor:
+            result = processor.get_answer_from_rag(
+                "q", "srd", True, False, {}, mock_lambda_logger
+            )
+
+        assert result["answer"] == "LLM Answer"
+        # The query embedding is written first, then the answer
+        assert mock_executor.submit.call_args_list == [
+            call(
+                processor._put_cached_embedding,
+                ANY,
+                [0.1, 0.2],
+                mock_lambda_logger,
+            ),
+            call(processor._put_cached_answer, ANY, mock_lambda_logger),
+        ]
+        item = mock_executor.submit.call_args[0][1]
+        assert "answer" not in item
+        answer_bytes = zstd.ZstdDecompressor().decompress(
+            item["answer_zstd"]["B"]
         )
+        assert answer_bytes == b"LLM Answer"
+        self.dynamodb_client.update_item.assert_not_called()